@@ -185,6 +185,31 @@ async def _make_call(
 
 
 
+# Cached "%Y-%m-%d %H:%M:%S" prefix for the current second: [epoch_second, formatted]
+_last_sec: list = [0, ""]
+
+
+def _log_timestamp() -> str:
+    """Return a millisecond-resolution timestamp, reformatting only when the second changes."""
+    now = time.time()
+    sec = int(now)
+    if sec != _last_sec[0]:
+        _last_sec[:] = [sec, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))]
+    return f"{_last_sec[1]}.{int((now - sec) * 1000):03d}"
+
+
+def _write_log_lines(log_file: Path, lines: list[str], mode: str) -> None:
+    """Write a batch of log lines to the phone call log file."""
+    with open(log_file, mode, encoding='utf-8') as f:
+        f.writelines(lines)
+
+
+def _write_debug_file(debug_file: Path, debug_info: dict[str, Any]) -> None:
+    """Dump the phone call debug info as JSON."""
+    with open(debug_file, 'w', encoding='utf-8') as f:
+        json.dump(debug_info, f, indent=2, ensure_ascii=False)
+
+
 async def phone_call(business_data: dict[str, Any], proposal: str) -> dict[str, Any]:
     """
     Function for calling a Business to discuss website development.
@@ -199,107 +224,39 @@ async def phone_call(business_data: dict[str, Any], proposal: str) -> dict[str,
     """
     
     logger.info("⚒️ [TOOL] 📞 Starting phone call tool...")
-    
-
-    # await asyncio.sleep(3)
-    # mock_result = {
-    #   "status": "done",
-    #   "transcript": [
-    #     {
-    #       "role": "agent",
-    #       "message": "Hello!.. This is Lexi from Web Solutions Inc. I hope I'm not catching you at a bad time. I'm calling to let you know about our website development services for you. Do you have just a quick moment to chat?"
-    #     },
-    #     {
-    #       "role": "user",
-    #       "message": "Yes, I would like to receive the email with proposal right away."
-    #     },
-    #     {
-    #       "role": "agent",
-    #       "message": "Great! I understand that The Sportsman has been a cornerstone of the Logan community for over seventy years, and I'd like..."
-    #     },
-    #     {
-    #       "role": "user",
-    #       "message": "Yes, just send it to MEINNPS at gmail.com."
-    #     },
-    #     {
-    #       "role": "agent",
-    #       "message": "Thank you for confirming your email address. Just to be clear, is that M. E. I. N. N. P. S. at gmail dot com? Also, do I..."
-    #     },
-    #     {
-    #       "role": "user",
-    #       "message": "Yes, sure."
-    #     },
-    #     {
-    #       "role": "agent",
-    #       "message": "Perfect! I'll send over the proposal right away. If you express interest by replying to the email, we'll create and send you a demo website MVP tailored to your business. After you review it, a..."
-    #     },
-    #     {
-    #       "role": "user",
-    #       "message": "Okay."
-    #     },
-    #     {
-    #       "role": "agent",
-    #       "message": "Great, I'm glad we could connect! I'm sending the email now, and a human from our team will contact you later. Have a great rest of your day!"
-    #     }
-    #   ],
-    #   "debug_info": [
-    #     "Initiating call → +14353173849",
-    #     "Call started (conversation_id = conv_01jxv205n2f2s96ycrcx00s1cx)",
-    #     "Polling status: initiated",
-    #     "Polling status: initiated",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: in-progress",
-    #     "Polling status: processing",
-    #     "Polling status: done"
-    #   ],
-    #   "error": None,
-    #   "conversation_id": "conv_01jxv205n2f2s96ycrcx00s1cx"
-    # }
-    
-    # return mock_result 
 
+    # Canned transcript for local testing without placing a real call
+    if os.environ.get("PHONE_CALL_MOCK"):
+        from ._fixtures.phone_mock import MOCK_CALL_RESULT
+        await asyncio.sleep(3)
+        return MOCK_CALL_RESULT
 
     # Initialize logging to file
     root_path = Path.cwd()
     log_file = root_path / "phone_call_tool_usage.log"
 
+    # Log lines are buffered and written off the event loop in batches
+    log_buffer = [f"=== PHONE CALL TOOL USAGE LOG - {datetime.now().isoformat()} ===\n\n"]
+    log_mode = ['w']  # First flush truncates the previous call's log
+
     def log_to_file(message: str):
-        """Write log message to file with timestamp"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(f"[{timestamp}] {message}\n")
-    
-    # Clear previous logs and start fresh for this call
-    with open(log_file, 'w', encoding='utf-8') as f:
-        f.write(f"=== PHONE CALL TOOL USAGE LOG - {datetime.now().isoformat()} ===\n\n")
-    
+        """Buffer log message with timestamp"""
+        timestamp = _log_timestamp()
+        log_buffer.append(f"[{timestamp}] {message}\n")
+
+    async def flush_log():
+        """Write buffered log lines to file without blocking the event loop"""
+        if not log_buffer:
+            return
+        lines = log_buffer[:]
+        log_buffer.clear()
+        mode = log_mode[0]
+        log_mode[0] = 'a'
+        try:
+            await asyncio.to_thread(_write_log_lines, log_file, lines, mode)
+        except Exception as e:
+            logger.warning(f"Failed to write phone call log: {e}")
+
     log_to_file("=" * 80)
     log_to_file("🔍 PHONE CALL FUNCTION DEBUG START")
     log_to_file("=" * 80)
@@ -321,6 +278,7 @@ async def phone_call(business_data: dict[str, Any], proposal: str) -> dict[str,
     if missing_vars:
         log_to_file(f"\n❌ Missing environment variables: {', '.join(missing_vars)}")
         log_to_file("Please set these environment variables before running the test.")
+        await flush_log()
         return "No valid environment variables found for ElevenLabs API. Please set ELEVENLABS_API_KEY, ELEVENLABS_AGENT_ID, and ELEVENLABS_PHONE_NUMBER_ID."
     
     # Make the call
@@ -347,6 +305,7 @@ async def phone_call(business_data: dict[str, Any], proposal: str) -> dict[str,
         if not validation["valid"]:
             log_to_file(f"❌ Phone number validation failed: {validation['error']}")
             log_to_file("\n💡 Please edit business_phone in this script with a valid US phone number")
+            await flush_log()
             return "Try another phone number or format"
 
         normalized_number = validation["normalized"]
@@ -360,6 +319,8 @@ async def phone_call(business_data: dict[str, Any], proposal: str) -> dict[str,
         )
 
 
+        await flush_log()
+
         start_time = time.time()
         result = await _make_call(
                to_number=normalized_number,
@@ -378,8 +339,7 @@ async def phone_call(business_data: dict[str, Any], proposal: str) -> dict[str,
     debug_file = root_path / "phone_call_debug_detailed.json"
     
     try:
-        with open(debug_file, 'w', encoding='utf-8') as f:
-            json.dump(debug_info, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(_write_debug_file, debug_file, debug_info)
         log_to_file("")
         log_to_file(f"💾 Debug info written to: {debug_file}")
     except Exception as e:
@@ -389,8 +349,8 @@ async def phone_call(business_data: dict[str, Any], proposal: str) -> dict[str,
     log_to_file("")
     log_to_file("🎭 CREATING MOCK CONVERSATION RESULT")
     log_to_file("-" * 50)
+    await flush_log()
 
-    
     return result
 
 # High level tool definition for phone call
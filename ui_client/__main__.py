@@ -15,7 +15,7 @@ import sys
 import uvicorn
 
 # Import the main app and configuration
-from ui_client.main import app
+from ui_client.main import app, UVLOOP_AVAILABLE
 import common.config as config
 
 def setup_logging(log_level: str = "INFO"):
@@ -103,6 +103,7 @@ def main():
         "workers": args.workers if not args.reload else 1,  # Workers > 1 incompatible with reload
         "access_log": True,
         "use_colors": True,
+        "loop": "uvloop" if UVLOOP_AVAILABLE else "asyncio",
     }
 
     # Remove workers if reload is enabled (they're incompatible)
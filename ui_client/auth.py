@@ -6,6 +6,7 @@ for the FastAPI application using Clerk as the authentication provider.
 """
 
 import os
+import asyncio
 import logging
 import httpx
 from functools import wraps
@@ -14,6 +15,7 @@ from datetime import datetime
 
 from fastapi import Request, HTTPException, Depends
 from fastapi.responses import RedirectResponse, JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
 from jose import jwt, jwk, JWTError
 from jose.utils import base64url_decode
 
@@ -38,34 +40,51 @@ CLERK_JWKS_URL = f"{CLERK_FRONTEND_API}/.well-known/jwks.json"
 _jwks_cache: Dict[str, Any] = {}
 _jwks_cache_time: Optional[datetime] = None
 JWKS_CACHE_DURATION = 3600  # 1 hour
+_jwks_lock = asyncio.Lock()  # Collapses concurrent refreshes into one fetch
+
+# Paths that never need the user resolved (assets and health probes)
+AUTH_SKIP_PREFIXES = ("/static", "/health")
+
+# Marks request.state as not yet carrying a resolved user
+_USER_UNSET = object()
+
+
+def _jwks_cache_valid(now: datetime) -> bool:
+    """Check whether the cached JWKS is still fresh."""
+    if _jwks_cache and _jwks_cache_time:
+        age = (now - _jwks_cache_time).total_seconds()
+        return age < JWKS_CACHE_DURATION
+    return False
 
 
 async def get_jwks() -> Dict[str, Any]:
     """Fetch and cache JWKS from Clerk."""
     global _jwks_cache, _jwks_cache_time
     
-    now = datetime.now()
-    
     # Return cached if valid
-    if _jwks_cache and _jwks_cache_time:
-        age = (now - _jwks_cache_time).total_seconds()
-        if age < JWKS_CACHE_DURATION:
-            return _jwks_cache
+    if _jwks_cache_valid(datetime.now()):
+        return _jwks_cache
     
-    # Fetch fresh JWKS
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(CLERK_JWKS_URL)
-            response.raise_for_status()
-            _jwks_cache = response.json()
-            _jwks_cache_time = now
-            logger.info("Successfully fetched Clerk JWKS")
+    async with _jwks_lock:
+        # Another coroutine may have refreshed while we waited for the lock
+        now = datetime.now()
+        if _jwks_cache_valid(now):
             return _jwks_cache
-    except Exception as e:
-        logger.error(f"Failed to fetch JWKS: {e}")
-        if _jwks_cache:
-            return _jwks_cache
-        raise HTTPException(status_code=500, detail="Authentication service unavailable")
+        
+        # Fetch fresh JWKS
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(CLERK_JWKS_URL)
+                response.raise_for_status()
+                _jwks_cache = response.json()
+                _jwks_cache_time = now
+                logger.info("Successfully fetched Clerk JWKS")
+                return _jwks_cache
+        except Exception as e:
+            logger.error(f"Failed to fetch JWKS: {e}")
+            if _jwks_cache:
+                return _jwks_cache
+            raise HTTPException(status_code=500, detail="Authentication service unavailable")
 
 
 def get_key_from_jwks(jwks: Dict[str, Any], kid: str) -> Optional[Dict]:
@@ -128,23 +147,17 @@ async def verify_clerk_token(token: str) -> Optional[Dict[str, Any]]:
 
 def extract_token_from_request(request: Request) -> Optional[str]:
     """Extract the Clerk session token from the request."""
-    
-    # Check Authorization header first
     auth_header = request.headers.get("Authorization", "")
-    if auth_header.startswith("Bearer "):
-        return auth_header[7:]
-    
-    # Check for __session cookie (Clerk's default)
-    session_cookie = request.cookies.get("__session")
-    if session_cookie:
-        return session_cookie
+    cookies = request.cookies
     
-    # Check for __clerk_db_jwt cookie (alternative)
-    clerk_jwt = request.cookies.get("__clerk_db_jwt")
-    if clerk_jwt:
-        return clerk_jwt
-    
-    return None
+    # Authorization header first, then __session cookie (Clerk's default),
+    # then __clerk_db_jwt cookie (alternative)
+    return (
+        (auth_header[7:] if auth_header.startswith("Bearer ") else None)
+        or cookies.get("__session")
+        or cookies.get("__clerk_db_jwt")
+        or None
+    )
 
 
 async def get_current_user(request: Request) -> Optional[Dict[str, Any]]:
@@ -152,13 +165,17 @@ async def get_current_user(request: Request) -> Optional[Dict[str, Any]]:
     Get the current authenticated user from the request.
     
     Returns the user payload if authenticated, None otherwise.
+    The result is stored on request.state so the token is only
+    verified once per request.
     """
-    token = extract_token_from_request(request)
-    
-    if not token:
-        return None
+    user = getattr(request.state, "user", _USER_UNSET)
+    if user is not _USER_UNSET:
+        return user
     
-    return await verify_clerk_token(token)
+    token = extract_token_from_request(request)
+    user = await verify_clerk_token(token) if token else None
+    request.state.user = user
+    return user
 
 
 async def require_auth(request: Request) -> Dict[str, Any]:
@@ -250,6 +267,21 @@ async def get_auth_state(request: Request) -> AuthState:
     return AuthState(user)
 
 
+class AuthMiddleware(BaseHTTPMiddleware):
+    """
+    Resolves the current user once per request and stores it on request.state.
+    
+    Static assets and health checks skip token extraction entirely.
+    """
+    
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path.startswith(AUTH_SKIP_PREFIXES):
+            request.state.user = None
+        else:
+            await get_current_user(request)
+        return await call_next(request)
+
+
 # Middleware helper for optional auth
 async def optional_auth(request: Request) -> Optional[Dict[str, Any]]:
     """
@@ -32,10 +32,17 @@ SCHEMA (24 fields - must match exactly):
 """
 
 import os
+import io
+import json
 import logging
+import time
 import asyncio
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Set
+import functools
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, FrozenSet, List, Optional
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -46,9 +53,55 @@ DATASET_ID = os.environ.get("DATASET_ID", "leadpilot_dataset")
 TABLE_ID = os.environ.get("TABLE_ID", "business_leads")
 CREDENTIALS_PATH = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "")
 
+# Fully-qualified table ID; insert/load calls accept it directly
+FULL_TABLE_ID = f"{PROJECT_ID}.{DATASET_ID}.{TABLE_ID}"
+_INSERT_ALL_PATH = f"/projects/{PROJECT_ID}/datasets/{DATASET_ID}/tables/{TABLE_ID}/insertAll"
+
+# Streaming insert batching: rows are coalesced into one insert_rows_json call
+MAX_BATCH = int(os.environ.get("BQ_MAX_BATCH", "500"))
+MAX_WAIT_MS = int(os.environ.get("BQ_MAX_WAIT_MS", "200"))
+
+# Upper bound on rows waiting for the flusher; beyond it callers insert directly
+MAX_QUEUE_SIZE = int(os.environ.get("BQ_MAX_QUEUE_SIZE", "10000"))
+
+# BigQuery recommends at most 500 rows per streaming insert request
+STREAMING_CHUNK = int(os.environ.get("BQ_STREAMING_CHUNK", "500"))
+
+# Per-attempt HTTP timeout for insertAll requests (retries come on top)
+INSERT_TIMEOUT_SECONDS = float(os.environ.get("BQ_INSERT_TIMEOUT", "30"))
+
+# Worker threads for blocking google-cloud-bigquery calls
+EXECUTOR_WORKERS = int(os.environ.get("BQ_EXECUTOR_WORKERS", "8"))
+
+# HTTP connection pool for the BigQuery REST client. The requests default
+# (10 connections) is smaller than the executor's concurrent inserts.
+HTTP_POOL_SIZE = int(os.environ.get("BQ_HTTP_POOL_SIZE", "16"))
+
+# Opt-in: verify/create the dataset and table at startup (deploy-time only)
+ENSURE_INFRA = os.environ.get("BQ_ENSURE_INFRA") == "1"
+
+# Opt-in: append rows through the Storage Write API default stream
+USE_STORAGE_WRITE = os.environ.get("BQ_USE_STORAGE_WRITE", "0") == "1"
+
+# get_leads_by_user results are cached per (user_id, status) for this long;
+# a successful persist for the user drops their entries. 0 disables the cache.
+QUERY_CACHE_TTL_SECONDS = float(os.environ.get("BQ_QUERY_CACHE_TTL", "30"))
+QUERY_CACHE_MAX_ENTRIES = 1024
+
+# get_leads_by_user queries. Kept byte-identical across calls so BigQuery's
+# cached-results feature can serve repeats.
+_SQL_BY_USER = (
+    f"SELECT * FROM `{FULL_TABLE_ID}` "
+    "WHERE user_id = @user_id ORDER BY updated_at DESC LIMIT 100"
+)
+_SQL_BY_USER_STATUS = (
+    f"SELECT * FROM `{FULL_TABLE_ID}` "
+    "WHERE user_id = @user_id AND status = @status ORDER BY updated_at DESC LIMIT 100"
+)
+
 # Authoritative schema - fields that exist in the actual BigQuery table
 # Any field NOT in this set will be stripped before insert
-VALID_SCHEMA_FIELDS: Set[str] = {
+VALID_SCHEMA_FIELDS: FrozenSet[str] = frozenset({
     "lead_id", "user_id", "user_email", "user_name", "status",
     "business_name", "business_phone", "business_email", "business_address",
     "business_city", "business_category", "business_rating",
@@ -56,22 +109,271 @@ VALID_SCHEMA_FIELDS: Set[str] = {
     "meeting_date", "meeting_time", "meeting_calendar_link",
     "email_sent", "email_sent_at", "email_subject",
     "created_at", "updated_at", "status_changed_at",
-}
+})
 
 # Required fields that must have values (non-null)
-REQUIRED_FIELDS: Set[str] = {
+REQUIRED_FIELDS: FrozenSet[str] = frozenset({
     "lead_id", "status", "business_name", "created_at", "updated_at"
-}
+})
 
 # Try to import BigQuery
 try:
+    import google.auth
+    from google.auth.transport.requests import AuthorizedSession, Request as AuthRequest
     from google.cloud import bigquery
+    from google.cloud.bigquery.retry import DEFAULT_RETRY
     from google.cloud.exceptions import NotFound, Conflict
+    from requests.adapters import HTTPAdapter
     BIGQUERY_AVAILABLE = True
 except ImportError:
     BIGQUERY_AVAILABLE = False
     logger.warning("google-cloud-bigquery not installed. BigQuery persistence disabled.")
 
+# Refresh credentials ahead of the one-hour token expiry
+CREDENTIALS_REFRESH_SECONDS = 50 * 60
+
+# orjson encodes the insertAll request body much faster than stdlib json (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import the Storage Write API client (optional)
+try:
+    from google.cloud import bigquery_storage_v1
+    from google.cloud.bigquery_storage_v1 import types as storage_types
+    from google.cloud.bigquery_storage_v1 import writer as storage_writer
+    from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+    STORAGE_WRITE_AVAILABLE = True
+except ImportError:
+    STORAGE_WRITE_AVAILABLE = False
+
+
+def _build_http_session():
+    """Create an authorized HTTP session with a connection pool of HTTP_POOL_SIZE.
+    
+    Credentials are resolved here, on first use, so a key written by the
+    app's startup (GOOGLE_CREDENTIALS_BASE64) is already in place.
+    """
+    credentials, _ = google.auth.default(
+        scopes=["https://www.googleapis.com/auth/bigquery"]
+    )
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    return credentials, session
+
+
+def _leads_schema() -> List["bigquery.SchemaField"]:
+    """Return the authoritative 24-field schema of the leads table."""
+    # Schema MUST match actual BigQuery table - 24 fields exactly
+    return [
+        # Lead Identification
+        bigquery.SchemaField("lead_id", "STRING", mode="REQUIRED", 
+                             description="Unique lead identifier"),
+        
+        # User Information
+        bigquery.SchemaField("user_id", "STRING", mode="NULLABLE",
+                             description="Authenticated user ID"),
+        bigquery.SchemaField("user_email", "STRING", mode="NULLABLE",
+                             description="User email address"),
+        bigquery.SchemaField("user_name", "STRING", mode="NULLABLE",
+                             description="User display name"),
+        
+        # Lead Status
+        bigquery.SchemaField("status", "STRING", mode="REQUIRED",
+                             description="Lead status: ENGAGED_SDR, CONVERTING, MEETING_SCHEDULED"),
+        
+        # Business Information
+        bigquery.SchemaField("business_name", "STRING", mode="REQUIRED",
+                             description="Business name"),
+        bigquery.SchemaField("business_phone", "STRING", mode="NULLABLE",
+                             description="Business phone number"),
+        bigquery.SchemaField("business_email", "STRING", mode="NULLABLE",
+                             description="Business email address"),
+        bigquery.SchemaField("business_address", "STRING", mode="NULLABLE",
+                             description="Business address"),
+        bigquery.SchemaField("business_city", "STRING", mode="NULLABLE",
+                             description="Business city"),
+        bigquery.SchemaField("business_category", "STRING", mode="NULLABLE",
+                             description="Business category/industry"),
+        bigquery.SchemaField("business_rating", "FLOAT", mode="NULLABLE",
+                             description="Business rating (1-5)"),
+        
+        # Research Data
+        bigquery.SchemaField("research_summary", "STRING", mode="NULLABLE",
+                             description="AI research summary"),
+        bigquery.SchemaField("research_industry", "STRING", mode="NULLABLE",
+                             description="Identified industry"),
+        bigquery.SchemaField("research_priority", "STRING", mode="NULLABLE",
+                             description="Lead priority: high, medium, low"),
+        
+        # Meeting Details - STRING type to match actual table
+        bigquery.SchemaField("meeting_date", "STRING", mode="NULLABLE",
+                             description="Scheduled meeting date (stored as string)"),
+        bigquery.SchemaField("meeting_time", "STRING", mode="NULLABLE",
+                             description="Scheduled meeting time (stored as string)"),
+        bigquery.SchemaField("meeting_calendar_link", "STRING", mode="NULLABLE",
+                             description="Calendar event link"),
+        
+        # Email Tracking
+        bigquery.SchemaField("email_sent", "BOOLEAN", mode="NULLABLE",
+                             description="Whether email was sent"),
+        bigquery.SchemaField("email_sent_at", "TIMESTAMP", mode="NULLABLE",
+                             description="When email was sent"),
+        bigquery.SchemaField("email_subject", "STRING", mode="NULLABLE",
+                             description="Email subject line"),
+        
+        # Timestamps
+        bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED",
+                             description="Record creation timestamp"),
+        bigquery.SchemaField("updated_at", "TIMESTAMP", mode="REQUIRED",
+                             description="Last update timestamp"),
+        bigquery.SchemaField("status_changed_at", "TIMESTAMP", mode="NULLABLE",
+                             description="When status was last changed"),
+    ]
+
+
+# BigQuery column type -> protobuf field type for Storage Write rows
+_PROTO_FIELD_TYPES = {
+    "STRING": "TYPE_STRING",
+    "FLOAT": "TYPE_DOUBLE",
+    "BOOLEAN": "TYPE_BOOL",
+    "TIMESTAMP": "TYPE_INT64",  # microseconds since epoch
+}
+
+
+def _utc_iso(dt: datetime) -> str:
+    """Format a datetime as a Z-suffixed UTC ISO-8601 string."""
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _iso_to_micros(value: str) -> int:
+    """Convert an ISO-8601 timestamp string to epoch microseconds (naive = UTC)."""
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1_000_000)
+
+
+class _StorageWriteAppender:
+    """
+    Appends lead rows to the table's `_default` stream via the Storage Write API.
+    
+    The protobuf descriptor is built at runtime from _leads_schema(), so no
+    generated *_pb2 module is needed. Rows are encoded as protobuf instead
+    of JSON; TIMESTAMP columns are sent as epoch microseconds.
+    """
+    
+    def __init__(self, project_id: str, dataset_id: str, table_id: str):
+        self._client = bigquery_storage_v1.BigQueryWriteClient()
+        self._write_stream = (
+            f"{self._client.table_path(project_id, dataset_id, table_id)}/streams/_default"
+        )
+        self._timestamp_fields = set()
+        self._row_class, self._proto_descriptor = self._build_row_class()
+        self._stream = None
+        self._lock = threading.Lock()
+    
+    def _build_row_class(self):
+        """Build the LeadRow protobuf message class from the table schema."""
+        file_proto = descriptor_pb2.FileDescriptorProto(
+            name="lead_row.proto", package="leadpilot", syntax="proto2"
+        )
+        message_proto = file_proto.message_type.add(name="LeadRow")
+        for number, field in enumerate(_leads_schema(), start=1):
+            if field.field_type == "TIMESTAMP":
+                self._timestamp_fields.add(field.name)
+            message_proto.field.add(
+                name=field.name,
+                number=number,
+                type=descriptor_pb2.FieldDescriptorProto.Type.Value(
+                    _PROTO_FIELD_TYPES[field.field_type]
+                ),
+                label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+            )
+        
+        pool = descriptor_pool.DescriptorPool()
+        pool.Add(file_proto)
+        descriptor = pool.FindMessageTypeByName("leadpilot.LeadRow")
+        try:
+            row_class = message_factory.GetMessageClass(descriptor)
+        except AttributeError:  # protobuf < 4.21
+            row_class = message_factory.MessageFactory(pool).GetPrototype(descriptor)
+        
+        proto_descriptor = descriptor_pb2.DescriptorProto()
+        descriptor.CopyToProto(proto_descriptor)
+        return row_class, proto_descriptor
+    
+    def _open_stream(self):
+        """Open the append stream with the writer schema as its request template."""
+        request_template = storage_types.AppendRowsRequest()
+        request_template.write_stream = self._write_stream
+        proto_data = storage_types.AppendRowsRequest.ProtoData()
+        proto_data.writer_schema = storage_types.ProtoSchema(
+            proto_descriptor=self._proto_descriptor
+        )
+        request_template.proto_rows = proto_data
+        return storage_writer.AppendRowsStream(self._client, request_template)
+    
+    def _serialize(self, row: Dict[str, Any]) -> bytes:
+        values = {
+            key: _iso_to_micros(value) if key in self._timestamp_fields else value
+            for key, value in row.items()
+        }
+        return self._row_class(**values).SerializeToString()
+    
+    def append(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Append rows and block until BigQuery acknowledges them.
+        
+        Returns row-level errors in the same shape as insert_rows_json
+        ({"index": i, "errors": [...]}) so callers can treat both paths alike.
+        """
+        proto_rows = storage_types.ProtoRows()
+        proto_rows.serialized_rows.extend(self._serialize(row) for row in rows)
+        request = storage_types.AppendRowsRequest()
+        proto_data = storage_types.AppendRowsRequest.ProtoData()
+        proto_data.rows = proto_rows
+        request.proto_rows = proto_data
+        
+        with self._lock:
+            if self._stream is None:
+                self._stream = self._open_stream()
+            try:
+                response = self._stream.send(request).result()
+            except Exception:
+                # A failed stream cannot be reused; reopen on the next append
+                self._stream.close()
+                self._stream = None
+                raise
+        
+        return [
+            {
+                "index": row_error.index,
+                "errors": [{"reason": row_error.code.name, "message": row_error.message}],
+            }
+            for row_error in response.row_errors
+        ]
+    
+    def close(self):
+        with self._lock:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+
+
+def _log_queued_insert(lead_id: str, future: asyncio.Future):
+    """Report the outcome of a fire-and-forget insert once its batch is flushed."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is None and future.result():
+        error = future.result()
+    if error:
+        logger.error("❌ Queued BigQuery insert FAILED for lead %s: %s", lead_id, error)
+
 
 class LeadStatus(str, Enum):
     """Lead lifecycle statuses for BigQuery tracking."""
@@ -92,23 +394,52 @@ class BigQueryLeadService:
     """
     
     _instance = None
+    _init_lock = threading.Lock()
     
     def __new__(cls):
         """Singleton pattern to reuse BigQuery client."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+        with cls._init_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
         return cls._instance
     
     def __init__(self):
-        if self._initialized:
+        with self._init_lock:
+            if self._initialized:
+                return
+            
+            self.client = None
+            self.dataset_ref = None
+            self.table_ref = None
+            self._queue: Optional[asyncio.Queue] = None
+            self._flush_task: Optional[asyncio.Task] = None
+            self._executor: Optional[ThreadPoolExecutor] = None
+            self._storage_writer: Optional[_StorageWriteAppender] = None
+            self._table_verified = False
+            self._infra_ensured = False
+            # (user_id, status) -> (expires_at, rows)
+            self._query_cache: Dict[tuple, tuple] = {}
+            self._credentials = None
+            self._refresh_task: Optional[asyncio.Task] = None
+            self._client_initialized = False
+            self._initialized = True
+    
+    def _ensure_client(self):
+        """Create the BigQuery client on first use, exactly once across threads."""
+        if self._client_initialized:
             return
-        
-        self.client = None
-        self.dataset_ref = None
-        self.table_ref = None
-        self._initialized = True
-        self._initialize_client()
+        with self._init_lock:
+            if self._client_initialized:
+                return
+            self._initialize_client()
+            self._ensure_infrastructure_if_requested()
+            self._client_initialized = True
+    
+    async def _ensure_client_async(self):
+        """Create the client off the event loop (credential lookup and setup block)."""
+        if not self._client_initialized:
+            await asyncio.to_thread(self._ensure_client)
     
     def _initialize_client(self):
         """Initialize the BigQuery client with service account credentials."""
@@ -121,33 +452,69 @@ class BigQueryLeadService:
             return
         
         try:
-            # Initialize client with project
-            self.client = bigquery.Client(project=PROJECT_ID)
-            self.dataset_ref = self.client.dataset(DATASET_ID)
-            self.table_ref = self.dataset_ref.table(TABLE_ID)
+            # Initialize client with project and a pooled HTTP session
+            credentials, http_session = _build_http_session()
+            self._credentials = credentials
+            self.client = bigquery.Client(
+                project=PROJECT_ID, credentials=credentials, _http=http_session
+            )
+            self._executor = ThreadPoolExecutor(
+                max_workers=EXECUTOR_WORKERS, thread_name_prefix="bigquery"
+            )
+            self.dataset_ref = bigquery.DatasetReference.from_string(f"{PROJECT_ID}.{DATASET_ID}")
+            self.table_ref = bigquery.TableReference.from_string(FULL_TABLE_ID)
             
             # Log full table path for verification
-            full_table_path = f"{PROJECT_ID}.{DATASET_ID}.{TABLE_ID}"
-            logger.info(f"🔗 BigQuery client initialized")
-            logger.info(f"   Project: {PROJECT_ID}")
-            logger.info(f"   Dataset: {DATASET_ID}")
-            logger.info(f"   Table: {TABLE_ID}")
-            logger.info(f"   Full path: {full_table_path}")
-            
-            # Ensure dataset and table exist
-            self._ensure_infrastructure()
+            logger.info("🔗 BigQuery client initialized (table: %s)", FULL_TABLE_ID)
             
-            # Verify table is accessible
-            try:
-                table = self.client.get_table(self.table_ref)
-                logger.info(f"✅ Table verified: {table.num_rows} existing rows, {len(table.schema)} schema fields")
-            except Exception as table_err:
-                logger.warning(f"⚠️ Could not verify table: {table_err}")
+            if USE_STORAGE_WRITE:
+                if STORAGE_WRITE_AVAILABLE:
+                    self._storage_writer = _StorageWriteAppender(PROJECT_ID, DATASET_ID, TABLE_ID)
+                    logger.info("🔗 Using BigQuery Storage Write API (default stream)")
+                else:
+                    logger.warning("⚠️ BQ_USE_STORAGE_WRITE set but google-cloud-bigquery-storage is not installed; using streaming inserts")
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize BigQuery client: {e}")
+            logger.error("❌ Failed to initialize BigQuery client: %s", e)
             self.client = None
     
+    def _ensure_infrastructure_if_requested(self):
+        """
+        Create the dataset/table if missing, only when BQ_ENSURE_INFRA=1.
+        
+        The hot path trusts the table exists and only creates it when an
+        insert hits a 404; this eager check is meant for deploys. Runs on the
+        executor so it does not block startup.
+        """
+        if not self.client or not ENSURE_INFRA:
+            return
+        
+        def ensure():
+            try:
+                self._ensure_infrastructure_once()
+            except Exception as infra_err:
+                logger.warning("⚠️ Could not ensure BigQuery infrastructure: %s", infra_err)
+        
+        self._executor.submit(ensure)
+    
+    async def _verify_table_once(self):
+        """Log the table state after the first insert failure to aid diagnosis."""
+        if self._table_verified:
+            return
+        self._table_verified = True
+        try:
+            table = await self._run_blocking(self.client.get_table, self.table_ref)
+            logger.info("✅ Table verified: %s existing rows, %s schema fields", table.num_rows, len(table.schema))
+        except Exception as table_err:
+            logger.warning("⚠️ Could not verify table: %s", table_err)
+    
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking BigQuery call on the service's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+    
     def _ensure_infrastructure(self):
         """Ensure dataset and table exist with proper schema."""
         if not self.client:
@@ -156,19 +523,19 @@ class BigQueryLeadService:
         # Ensure dataset exists
         try:
             self.client.get_dataset(self.dataset_ref)
-            logger.info(f"Dataset {DATASET_ID} exists")
+            logger.info("Dataset %s exists", DATASET_ID)
         except NotFound:
-            logger.info(f"Creating dataset {DATASET_ID}")
+            logger.info("Creating dataset %s", DATASET_ID)
             dataset = bigquery.Dataset(self.dataset_ref)
             dataset.description = "LeadPilot confirmed leads tracking"
             dataset.location = "US"
             self.client.create_dataset(dataset)
-            logger.info(f"Dataset {DATASET_ID} created")
+            logger.info("Dataset %s created", DATASET_ID)
         
         # Ensure table exists with proper schema
         try:
             self.client.get_table(self.table_ref)
-            logger.info(f"Table {TABLE_ID} exists")
+            logger.info("Table %s exists", TABLE_ID)
         except NotFound:
             self._create_leads_table()
     
@@ -177,74 +544,9 @@ class BigQueryLeadService:
         if not self.client:
             return
         
-        logger.info(f"Creating table {TABLE_ID}")
+        logger.info("Creating table %s", TABLE_ID)
         
-        # Schema MUST match actual BigQuery table - 24 fields exactly
-        schema = [
-            # Lead Identification
-            bigquery.SchemaField("lead_id", "STRING", mode="REQUIRED", 
-                                 description="Unique lead identifier"),
-            
-            # User Information
-            bigquery.SchemaField("user_id", "STRING", mode="NULLABLE",
-                                 description="Authenticated user ID"),
-            bigquery.SchemaField("user_email", "STRING", mode="NULLABLE",
-                                 description="User email address"),
-            bigquery.SchemaField("user_name", "STRING", mode="NULLABLE",
-                                 description="User display name"),
-            
-            # Lead Status
-            bigquery.SchemaField("status", "STRING", mode="REQUIRED",
-                                 description="Lead status: ENGAGED_SDR, CONVERTING, MEETING_SCHEDULED"),
-            
-            # Business Information
-            bigquery.SchemaField("business_name", "STRING", mode="REQUIRED",
-                                 description="Business name"),
-            bigquery.SchemaField("business_phone", "STRING", mode="NULLABLE",
-                                 description="Business phone number"),
-            bigquery.SchemaField("business_email", "STRING", mode="NULLABLE",
-                                 description="Business email address"),
-            bigquery.SchemaField("business_address", "STRING", mode="NULLABLE",
-                                 description="Business address"),
-            bigquery.SchemaField("business_city", "STRING", mode="NULLABLE",
-                                 description="Business city"),
-            bigquery.SchemaField("business_category", "STRING", mode="NULLABLE",
-                                 description="Business category/industry"),
-            bigquery.SchemaField("business_rating", "FLOAT", mode="NULLABLE",
-                                 description="Business rating (1-5)"),
-            
-            # Research Data
-            bigquery.SchemaField("research_summary", "STRING", mode="NULLABLE",
-                                 description="AI research summary"),
-            bigquery.SchemaField("research_industry", "STRING", mode="NULLABLE",
-                                 description="Identified industry"),
-            bigquery.SchemaField("research_priority", "STRING", mode="NULLABLE",
-                                 description="Lead priority: high, medium, low"),
-            
-            # Meeting Details - STRING type to match actual table
-            bigquery.SchemaField("meeting_date", "STRING", mode="NULLABLE",
-                                 description="Scheduled meeting date (stored as string)"),
-            bigquery.SchemaField("meeting_time", "STRING", mode="NULLABLE",
-                                 description="Scheduled meeting time (stored as string)"),
-            bigquery.SchemaField("meeting_calendar_link", "STRING", mode="NULLABLE",
-                                 description="Calendar event link"),
-            
-            # Email Tracking
-            bigquery.SchemaField("email_sent", "BOOLEAN", mode="NULLABLE",
-                                 description="Whether email was sent"),
-            bigquery.SchemaField("email_sent_at", "TIMESTAMP", mode="NULLABLE",
-                                 description="When email was sent"),
-            bigquery.SchemaField("email_subject", "STRING", mode="NULLABLE",
-                                 description="Email subject line"),
-            
-            # Timestamps
-            bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED",
-                                 description="Record creation timestamp"),
-            bigquery.SchemaField("updated_at", "TIMESTAMP", mode="REQUIRED",
-                                 description="Last update timestamp"),
-            bigquery.SchemaField("status_changed_at", "TIMESTAMP", mode="NULLABLE",
-                                 description="When status was last changed"),
-        ]
+        schema = _leads_schema()
         
         table = bigquery.Table(self.table_ref, schema=schema)
         table.description = "LeadPilot confirmed leads with user tracking"
@@ -257,42 +559,320 @@ class BigQueryLeadService:
         table.clustering_fields = ["user_id", "status", "business_city"]
         
         self.client.create_table(table)
-        logger.info(f"Table {TABLE_ID} created successfully")
+        logger.info("Table %s created successfully", TABLE_ID)
     
     def _validate_and_clean_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate row against schema and remove any fields not in schema.
         This ensures we NEVER try to insert fields that don't exist in the table.
         """
-        # Strip any fields not in the valid schema
-        cleaned = {}
-        stripped_fields = []
-        
-        for key, value in row.items():
-            if key in VALID_SCHEMA_FIELDS:
-                cleaned[key] = value
-            else:
-                stripped_fields.append(key)
+        # Strip any fields not in the valid schema (set ops run in C)
+        stripped_fields = row.keys() - VALID_SCHEMA_FIELDS
+        if not stripped_fields:
+            return dict(row)
         
-        if stripped_fields:
-            logger.warning(f"⚠️ Stripped non-schema fields: {stripped_fields}")
-        
-        return cleaned
+        logger.warning("⚠️ Stripped non-schema fields: %s", sorted(stripped_fields))
+        return {key: row[key] for key in row.keys() & VALID_SCHEMA_FIELDS}
     
     def _validate_required_fields(self, row: Dict[str, Any]) -> Optional[str]:
         """
         Check that all required fields are present and non-null.
         Returns error message if validation fails, None if valid.
         """
-        missing = []
-        for field in REQUIRED_FIELDS:
-            if field not in row or row[field] is None:
-                missing.append(field)
-        
+        present_nonnull = {key for key, value in row.items() if value is not None}
+        missing = REQUIRED_FIELDS - present_nonnull
         if missing:
-            return f"Missing required fields: {missing}"
+            return f"Missing required fields: {sorted(missing)}"
         return None
 
+    def _insert_all(self, rows: List[Dict[str, Any]], row_ids: List[str]) -> List[Any]:
+        """
+        Streaming insert of one request's worth of rows (blocking).
+        
+        With orjson available the tabledata.insertAll body is pre-encoded
+        and posted through the client's connection, skipping the stdlib
+        json encoder used by insert_rows_json. The request gets the same
+        DEFAULT_RETRY as insert_rows_json plus an explicit timeout, and
+        returns the same row-level error list.
+        """
+        if not ORJSON_AVAILABLE:
+            return self.client.insert_rows_json(
+                FULL_TABLE_ID, rows, row_ids=row_ids, timeout=INSERT_TIMEOUT_SECONDS
+            )
+        
+        body = orjson.dumps({
+            "rows": [{"insertId": row_id, "json": row} for row, row_id in zip(rows, row_ids)]
+        })
+        # Bytes bodies are sent as-is by the connection (no json.dumps pass)
+        api_request = functools.partial(
+            self.client._connection.api_request,
+            method="POST",
+            path=_INSERT_ALL_PATH,
+            data=body,
+            content_type="application/json",
+            timeout=INSERT_TIMEOUT_SECONDS,
+        )
+        response = DEFAULT_RETRY(api_request)()
+        return response.get("insertErrors", [])
+    
+    async def _insert_rows(self, rows: List[Dict[str, Any]], row_ids: List[str]) -> List[Any]:
+        """
+        Insert rows and return BigQuery's row-level errors.
+        
+        There is no existence check up front: if the table is missing, the
+        dataset/table are created once and the insert is retried.
+        """
+        try:
+            return await self._send_rows(rows, row_ids)
+        except NotFound:
+            if self._infra_ensured:
+                raise
+            logger.warning("⚠️ BigQuery table not found, creating dataset/table and retrying")
+            await self._run_blocking(self._ensure_infrastructure_once)
+            return await self._send_rows(rows, row_ids)
+    
+    def _ensure_infrastructure_once(self):
+        """Create the dataset/table at most once per process (blocking)."""
+        with self._init_lock:
+            if not self._infra_ensured:
+                self._ensure_infrastructure()
+                self._infra_ensured = True
+    
+    async def _send_rows(self, rows: List[Dict[str, Any]], row_ids: List[str]) -> List[Any]:
+        """Send rows through the configured write path (Storage Write or streaming)."""
+        if self._storage_writer is not None:
+            # Default stream is at-least-once; row_ids only apply to insertAll
+            return await self._run_blocking(self._storage_writer.append, rows)
+        if len(rows) <= STREAMING_CHUNK:
+            return await self._run_blocking(self._insert_all, rows, row_ids)
+        
+        # Split oversized batches; shift error indexes back to batch positions
+        errors = []
+        for start in range(0, len(rows), STREAMING_CHUNK):
+            end = start + STREAMING_CHUNK
+            chunk_errors = await self._run_blocking(
+                self._insert_all, rows[start:end], row_ids[start:end]
+            )
+            for error in chunk_errors or []:
+                if isinstance(error, dict) and "index" in error:
+                    error = {**error, "index": error["index"] + start}
+                errors.append(error)
+        return errors
+    
+    def _load_rows(self, rows: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Append rows with a free NDJSON load job and wait for it (blocking).
+        
+        Returns the job's errors; a job that fails outright raises.
+        """
+        if ORJSON_AVAILABLE:
+            payload = b"".join(orjson.dumps(row) + b"\n" for row in rows)
+        else:
+            payload = b"".join(json.dumps(row).encode("utf-8") + b"\n" for row in rows)
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            schema=_leads_schema(),
+        )
+        job = self.client.load_table_from_file(io.BytesIO(payload), FULL_TABLE_ID, job_config=job_config)
+        job.result()
+        return job.errors or []
+    
+    async def _load_rows_with_recovery(self, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Run a load job, creating the dataset/table once if it is missing."""
+        try:
+            return await self._run_blocking(self._load_rows, rows)
+        except NotFound:
+            if self._infra_ensured:
+                raise
+            logger.warning("⚠️ BigQuery table not found, creating dataset/table and retrying load")
+            await self._run_blocking(self._ensure_infrastructure_once)
+            return await self._run_blocking(self._load_rows, rows)
+    
+    def _ensure_credentials_refresher(self):
+        """Start the background credentials refresh task on the running loop if needed."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_credentials_loop())
+    
+    async def _refresh_credentials_loop(self):
+        """Refresh the access token every CREDENTIALS_REFRESH_SECONDS so inserts never wait on it."""
+        while True:
+            await asyncio.sleep(CREDENTIALS_REFRESH_SECONDS)
+            try:
+                await self._run_blocking(self._credentials.refresh, AuthRequest())
+                logger.debug("Refreshed BigQuery credentials")
+            except Exception as e:
+                logger.warning("⚠️ BigQuery credentials refresh failed: %s", e)
+    
+    def _ensure_flusher(self) -> asyncio.Queue:
+        """Start the background batch flusher on the running loop if needed."""
+        if self._flush_task is None or self._flush_task.done():
+            # Keep an existing queue: rows already waiting in it still need a flusher
+            if self._queue is None:
+                self._queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        return self._queue
+    
+    def _try_enqueue(self, row: Dict[str, Any], row_id: str) -> Optional[asyncio.Future]:
+        """
+        Queue a row for the next batched insert.
+        
+        Returns a future resolving to the row's errors, or None if the queue is full.
+        """
+        queue = self._ensure_flusher()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            queue.put_nowait((row, row_id, future))
+        except asyncio.QueueFull:
+            return None
+        return future
+    
+    async def _flush_loop(self):
+        """
+        Drain queued rows and insert them in batches.
+        
+        A batch is flushed once MAX_BATCH rows are queued or MAX_WAIT_MS has
+        passed since its first row arrived. Row-level errors returned by
+        BigQuery are mapped back to each caller by index.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + MAX_WAIT_MS / 1000
+            while len(batch) < MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            rows = [row for row, _, _ in batch]
+            row_ids = [row_id for _, row_id, _ in batch]
+            try:
+                errors = await self._insert_rows(rows, row_ids)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            # Errors without an index apply to the whole batch
+            errors_by_index: Dict[Optional[int], List[Any]] = {}
+            for error in errors or []:
+                index = error.get("index") if isinstance(error, dict) else None
+                errors_by_index.setdefault(index, []).append(error)
+            
+            for i, (_, _, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result(errors_by_index.get(i, []) + errors_by_index.get(None, []))
+
+    def _build_row(
+        self,
+        lead_id: str,
+        status: LeadStatus,
+        now_iso: str,
+        user_info: Dict[str, Any],
+        lead_details: Dict[str, Any],
+        meeting_details: Optional[Dict[str, Any]],
+        email_details: Optional[Dict[str, Any]],
+        research_data: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Build the insert row in a single pass.
+        
+        Only schema columns are ever assigned and None values are skipped
+        (BigQuery treats missing fields as NULL), so no separate cleaning
+        pass is needed.
+        """
+        row = {
+            # Required fields
+            "lead_id": str(lead_id).strip(),
+            "status": status.value,
+            "business_name": str(lead_details.get("name", "Unknown")).strip() or "Unknown",
+            "created_at": now_iso,
+            "updated_at": now_iso,
+            "status_changed_at": now_iso,
+        }
+        
+        # User info (nullable)
+        user_id = user_info.get("user_id")
+        if user_id:
+            row["user_id"] = str(user_id).strip()
+        v = user_info.get("email")
+        if v is not None:
+            row["user_email"] = v
+        v = user_info.get("name")
+        if v is not None:
+            row["user_name"] = v
+        
+        # Business info (nullable)
+        v = lead_details.get("phone")
+        if v is not None:
+            row["business_phone"] = v
+        v = lead_details.get("email")
+        if v is not None:
+            row["business_email"] = v
+        v = lead_details.get("address")
+        if v is not None:
+            row["business_address"] = v
+        v = lead_details.get("city")
+        if v is not None:
+            row["business_city"] = v
+        v = lead_details.get("category")
+        if v is not None:
+            row["business_category"] = v
+        
+        # Handle business_rating carefully (must be FLOAT)
+        rating = lead_details.get("rating")
+        if rating is not None:
+            try:
+                row["business_rating"] = float(rating)
+            except (ValueError, TypeError):
+                logger.warning("⚠️ Invalid rating value: %s, setting to None", rating)
+        
+        # Add research data if available
+        if research_data:
+            overview = research_data.get("overview")
+            if overview:
+                row["research_summary"] = str(overview)[:5000]
+            v = research_data.get("industry")
+            if v is not None:
+                row["research_industry"] = v
+            # Safely extract priority from nested structure
+            recommendation = research_data.get("recommendation")
+            if isinstance(recommendation, dict):
+                v = recommendation.get("priority")
+                if v is not None:
+                    row["research_priority"] = v
+        
+        # Add email details if available
+        if email_details:
+            row["email_sent"] = True
+            sent_at = email_details.get("sent_at")
+            if isinstance(sent_at, datetime):
+                row["email_sent_at"] = _utc_iso(sent_at)
+            else:
+                # BigQuery reads zone-less timestamp strings as UTC
+                row["email_sent_at"] = str(sent_at) if sent_at else now_iso
+            v = email_details.get("subject")
+            if v is not None:
+                row["email_subject"] = v
+        
+        # Add meeting details if status is MEETING_SCHEDULED
+        if status == LeadStatus.MEETING_SCHEDULED and meeting_details:
+            # meeting_date and meeting_time are STRING type
+            if meeting_details.get("date"):
+                row["meeting_date"] = str(meeting_details["date"])
+            if meeting_details.get("time"):
+                row["meeting_time"] = str(meeting_details["time"])
+            v = meeting_details.get("calendar_link")
+            if v is not None:
+                row["meeting_calendar_link"] = v
+        
+        return row
+
     async def persist_lead_status(
         self,
         lead_id: str,
@@ -303,6 +883,8 @@ class BigQueryLeadService:
         email_details: Optional[Dict[str, Any]] = None,
         research_data: Optional[Dict[str, Any]] = None,
         previous_status: Optional[str] = None,
+        fire_and_forget: bool = False,
+        event_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Persist a lead status update to BigQuery.
@@ -316,135 +898,87 @@ class BigQueryLeadService:
             user_info: Dict with user_id, email, name
             lead_details: Business information dict
             meeting_details: Optional meeting info (date, time, link)
-            email_details: Optional email tracking info
+            email_details: Optional email tracking info (sent_at as a datetime)
             research_data: Optional AI research data
             previous_status: Previous status if known (ignored - not in schema)
+            fire_and_forget: Return once the row is queued instead of waiting
+                for the batched insert; failures are only logged
+            event_id: Key of this logical write. Pass the event_id returned
+                by a failed attempt when retrying so BigQuery deduplicates
+                it; a new one is generated when omitted
             
         Returns:
             Dict with success status and any error message
         """
+        await self._ensure_client_async()
+        
         # Pre-flight check: is BigQuery available?
         if not self.client:
             logger.warning("⏭️ BigQuery client not available - skipping persistence for lead %s", lead_id)
             return {"success": False, "error": "BigQuery not configured", "skipped": True}
         
+        self._ensure_credentials_refresher()
+        
         # Validate lead_id
         if not lead_id or not str(lead_id).strip():
             logger.error("❌ Cannot persist: lead_id is empty or None")
             return {"success": False, "error": "lead_id is required"}
         
+        event_id = event_id or uuid.uuid4().hex
+        
         try:
-            now = datetime.utcnow()
-            now_iso = now.isoformat() + "Z"
+            now = datetime.now(timezone.utc)
+            now_iso = _utc_iso(now)
+            status_value = status.value
             
-            logger.info(f"📝 Preparing BigQuery insert for lead: {lead_id}, status: {status.value}")
-            logger.info(f"   Target: {PROJECT_ID}.{DATASET_ID}.{TABLE_ID}")
+            logger.debug("📝 Preparing BigQuery insert for lead %s, status: %s", lead_id, status_value)
             
             # Build the row data - STRICTLY aligned with actual table schema (24 fields)
-            row = {
-                # Required fields
-                "lead_id": str(lead_id).strip(),
-                "status": status.value,
-                "business_name": str(lead_details.get("name", "Unknown")).strip() or "Unknown",
-                "created_at": now_iso,
-                "updated_at": now_iso,
-                
-                # User info (nullable)
-                "user_id": str(user_info.get("user_id")).strip() if user_info.get("user_id") else None,
-                "user_email": user_info.get("email"),
-                "user_name": user_info.get("name"),
-                
-                # Business info (nullable)
-                "business_phone": lead_details.get("phone"),
-                "business_email": lead_details.get("email"),
-                "business_address": lead_details.get("address"),
-                "business_city": lead_details.get("city"),
-                "business_category": lead_details.get("category"),
-                "business_rating": None,
-                
-                # Research data (nullable)
-                "research_summary": None,
-                "research_industry": None,
-                "research_priority": None,
-                
-                # Meeting details (nullable) - stored as STRING
-                "meeting_date": None,
-                "meeting_time": None,
-                "meeting_calendar_link": None,
-                
-                # Email tracking (nullable)
-                "email_sent": None,
-                "email_sent_at": None,
-                "email_subject": None,
-                
-                # Status changed (nullable)
-                "status_changed_at": now_iso,
-            }
-            
-            # Handle business_rating carefully (must be FLOAT)
-            rating = lead_details.get("rating")
-            if rating is not None:
-                try:
-                    row["business_rating"] = float(rating)
-                except (ValueError, TypeError):
-                    logger.warning(f"⚠️ Invalid rating value: {rating}, setting to None")
-                    row["business_rating"] = None
-            
-            # Add research data if available
-            if research_data:
-                overview = research_data.get("overview")
-                if overview:
-                    row["research_summary"] = str(overview)[:5000]
-                row["research_industry"] = research_data.get("industry")
-                # Safely extract priority from nested structure
-                recommendation = research_data.get("recommendation")
-                if isinstance(recommendation, dict):
-                    row["research_priority"] = recommendation.get("priority")
-            
-            # Add email details if available
-            if email_details:
-                row["email_sent"] = True
-                sent_at = email_details.get("sent_at")
-                if sent_at:
-                    sent_at_str = str(sent_at)
-                    row["email_sent_at"] = sent_at_str if "Z" in sent_at_str else sent_at_str + "Z"
-                else:
-                    row["email_sent_at"] = now_iso
-                row["email_subject"] = email_details.get("subject")
-            
-            # Add meeting details if status is MEETING_SCHEDULED
-            if status == LeadStatus.MEETING_SCHEDULED and meeting_details:
-                # meeting_date and meeting_time are STRING type
-                if meeting_details.get("date"):
-                    row["meeting_date"] = str(meeting_details["date"])
-                if meeting_details.get("time"):
-                    row["meeting_time"] = str(meeting_details["time"])
-                row["meeting_calendar_link"] = meeting_details.get("calendar_link")
-            
-            # CRITICAL: Validate and clean row against schema
-            row_validated = self._validate_and_clean_row(row)
-            
-            # Remove None values (BigQuery handles missing fields as NULL)
-            row_cleaned = {k: v for k, v in row_validated.items() if v is not None}
+            row_cleaned = self._build_row(
+                lead_id, status, now_iso, user_info, lead_details,
+                meeting_details, email_details, research_data,
+            )
+            if __debug__:
+                # Schema membership is guaranteed by construction
+                assert self._validate_and_clean_row(row_cleaned) == row_cleaned
             
             # Validate required fields
             validation_error = self._validate_required_fields(row_cleaned)
             if validation_error:
-                logger.error(f"❌ Validation failed for lead {lead_id}: {validation_error}")
+                logger.error("❌ Validation failed for lead %s: %s", lead_id, validation_error)
                 return {"success": False, "error": validation_error, "lead_id": lead_id}
             
             # Log exactly what we're inserting
-            logger.info(f"📤 Inserting {len(row_cleaned)} fields: {sorted(row_cleaned.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📤 Inserting %d fields: %s", len(row_cleaned), sorted(row_cleaned.keys()))
             
-            # Generate unique row ID for deduplication
-            row_id = f"{lead_id}_{status.value}_{int(now.timestamp())}"
+            # One insertId per logical write: internal retries reuse it and are
+            # dropped by BigQuery's streaming dedup, while separate writes with
+            # identical content stay distinct
+            row_id = f"{lead_id}_{status_value}_{event_id}"
             
             # Execute the insert
-            errors = self.client.insert_rows_json(
-                self.table_ref,
-                [row_cleaned],
-                row_ids=[row_id]
-            )
+            if status == LeadStatus.MEETING_SCHEDULED:
+                # Latency matters here, so skip the batch window
+                errors = await self._insert_rows([row_cleaned], [row_id])
+            else:
+                future = self._try_enqueue(row_cleaned, row_id)
+                if future is None:
+                    # Never drop data: fall back to a direct insert
+                    logger.warning("⚠️ BigQuery insert queue full, inserting lead %s directly", lead_id)
+                    errors = await self._insert_rows([row_cleaned], [row_id])
+                elif fire_and_forget:
+                    future.add_done_callback(functools.partial(_log_queued_insert, lead_id))
+                    self._invalidate_user_queries(row_cleaned.get("user_id"))
+                    return {
+                        "success": True,
+                        "queued": True,
+                        "lead_id": lead_id,
+                        "status": status_value,
+                        "row_id": row_id,
+                    }
+                else:
+                    errors = await future
             
             # CRITICAL: Explicitly check for row-level errors
             # insert_rows_json returns a list of errors (empty list = success)
@@ -462,31 +996,81 @@ class BigQueryLeadService:
                         error_details.append(str(error))
                 
                 error_msg = "; ".join(error_details) if error_details else str(errors)
-                logger.error(f"❌ BigQuery INSERT FAILED for lead {lead_id}")
-                logger.error(f"   Error: {error_msg}")
-                logger.error(f"   Row data: {row_cleaned}")
+                logger.error(
+                    "❌ BigQuery INSERT FAILED for lead %s\n   Error: %s\n   Row data: %s",
+                    lead_id, error_msg, row_cleaned,
+                )
+                await self._verify_table_once()
                 return {
                     "success": False, 
                     "error": error_msg, 
                     "lead_id": lead_id,
-                    "row_id": row_id
+                    "row_id": row_id,
+                    "event_id": event_id,
                 }
             
             # SUCCESS - no errors returned
-            logger.info(f"✅ BigQuery INSERT SUCCESS for lead {lead_id}")
-            logger.info(f"   Status: {status.value}")
-            logger.info(f"   Business: {row_cleaned.get('business_name')}")
-            logger.info(f"   Row ID: {row_id}")
+            self._invalidate_user_queries(row_cleaned.get("user_id"))
+            logger.info(
+                "✅ BigQuery INSERT SUCCESS for lead %s (status: %s, business: %s, row ID: %s)",
+                lead_id, status_value, row_cleaned.get("business_name"), row_id,
+            )
             
             return {
                 "success": True, 
                 "lead_id": lead_id, 
-                "status": status.value,
+                "status": status_value,
                 "row_id": row_id
             }
             
         except Exception as e:
-            logger.error(f"❌ Exception persisting lead to BigQuery: {e}", exc_info=True)
+            logger.error("❌ Exception persisting lead to BigQuery: %s", e, exc_info=True)
+            await self._verify_table_once()
+            return {"success": False, "error": str(e), "event_id": event_id}
+    
+    async def persist_leads_bulk(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Backfill many lead rows with a single load job instead of streaming.
+        
+        Load jobs are free and much faster than streaming for thousands of
+        rows, but do not deduplicate on row IDs.
+        
+        Args:
+            rows: Rows keyed by schema column; non-schema keys and None values are dropped
+            
+        Returns:
+            Dict with success status, number of rows loaded and any error message
+        """
+        await self._ensure_client_async()
+        if not self.client:
+            return {"success": False, "error": "BigQuery not configured", "skipped": True}
+        
+        cleaned_rows = []
+        for row in rows:
+            cleaned = {k: v for k, v in self._validate_and_clean_row(row).items() if v is not None}
+            validation_error = self._validate_required_fields(cleaned)
+            if validation_error:
+                return {"success": False, "error": validation_error, "lead_id": row.get("lead_id")}
+            cleaned_rows.append(cleaned)
+        
+        if not cleaned_rows:
+            return {"success": True, "rows": 0}
+        
+        try:
+            errors = await self._load_rows_with_recovery(cleaned_rows)
+            for user_id in {row.get("user_id") for row in cleaned_rows}:
+                self._invalidate_user_queries(user_id)
+            if errors:
+                error_msg = "; ".join(
+                    error.get("message", str(error)) if isinstance(error, dict) else str(error)
+                    for error in errors
+                )
+                logger.error("❌ BigQuery load job reported errors: %s", error_msg)
+                return {"success": False, "error": error_msg, "rows": len(cleaned_rows)}
+            logger.info("✅ BigQuery load job appended %d rows", len(cleaned_rows))
+            return {"success": True, "rows": len(cleaned_rows)}
+        except Exception as e:
+            logger.error("❌ BigQuery load job failed: %s", e)
             return {"success": False, "error": str(e)}
     
     async def get_leads_by_user(self, user_id: str, status: Optional[LeadStatus] = None) -> List[Dict[str, Any]]:
@@ -500,18 +1084,17 @@ class BigQueryLeadService:
         Returns:
             List of lead records
         """
+        await self._ensure_client_async()
         if not self.client:
             return []
         
+        cache_key = (user_id, status.value if status else None)
+        cached = self._query_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return list(cached[1])
+        
         try:
-            query = f"""
-                SELECT *
-                FROM `{PROJECT_ID}.{DATASET_ID}.{TABLE_ID}`
-                WHERE user_id = @user_id
-                {"AND status = @status" if status else ""}
-                ORDER BY updated_at DESC
-                LIMIT 100
-            """
+            query = _SQL_BY_USER_STATUS if status else _SQL_BY_USER
             
             job_config = bigquery.QueryJobConfig(
                 query_parameters=[
@@ -524,17 +1107,38 @@ class BigQueryLeadService:
                     bigquery.ScalarQueryParameter("status", "STRING", status.value)
                 )
             
-            query_job = self.client.query(query, job_config=job_config)
-            results = query_job.result()
+            def run_query():
+                query_job = self.client.query(query, job_config=job_config)
+                return [dict(row) for row in query_job.result()]
             
-            return [dict(row) for row in results]
+            rows = await self._run_blocking(run_query)
+            if QUERY_CACHE_TTL_SECONDS > 0:
+                if len(self._query_cache) >= QUERY_CACHE_MAX_ENTRIES:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self._query_cache.pop(next(iter(self._query_cache)))
+                self._query_cache[cache_key] = (time.monotonic() + QUERY_CACHE_TTL_SECONDS, rows)
+            return list(rows)
             
         except Exception as e:
-            logger.error(f"Failed to query leads: {e}")
+            logger.error("Failed to query leads: %s", e)
             return []
     
+    def _invalidate_user_queries(self, user_id: Optional[str]):
+        """Drop cached get_leads_by_user results for a user after a write."""
+        if not self._query_cache:
+            return
+        for key in [key for key in self._query_cache if key[0] == user_id]:
+            del self._query_cache[key]
+    
     def is_available(self) -> bool:
-        """Check if BigQuery service is available."""
+        """
+        Check if BigQuery service is available.
+        
+        Never blocks: before the client is created (on the first persist or
+        query) this only reports whether BigQuery is configured.
+        """
+        if not self._client_initialized:
+            return BIGQUERY_AVAILABLE and bool(PROJECT_ID)
         return self.client is not None
 
 
@@ -567,25 +1171,29 @@ async def persist_sdr_engaged(
         logger.warning("⏭️ persist_sdr_engaged: No lead_id provided, skipping")
         return {"success": False, "error": "No lead_id provided", "skipped": True}
     
-    logger.info(f"🔔 PERSIST EVENT: SDR_ENGAGED for lead {lead_id}")
+    logger.info("🔔 PERSIST EVENT: SDR_ENGAGED for lead %s", lead_id)
     service = get_bigquery_service()
     
     if not service.is_available():
-        logger.warning(f"⏭️ BigQuery not available, skipping persist for lead {lead_id}")
+        logger.warning("⏭️ BigQuery not available, skipping persist for lead %s", lead_id)
         return {"success": False, "error": "BigQuery not available", "skipped": True}
     
+    # Observational event: don't hold the SDR path on a BigQuery round-trip
     result = await service.persist_lead_status(
         lead_id=lead_id,
         status=LeadStatus.ENGAGED_SDR,
         user_info=user_info or {},
         lead_details=lead_details or {},
         research_data=research_data,
+        fire_and_forget=True,
     )
     
-    if result.get("success"):
-        logger.info(f"✅ SDR_ENGAGED persisted successfully for lead {lead_id}")
+    if result.get("queued"):
+        logger.info("✅ SDR_ENGAGED queued for lead %s", lead_id)
+    elif result.get("success"):
+        logger.info("✅ SDR_ENGAGED persisted successfully for lead %s", lead_id)
     else:
-        logger.error(f"❌ SDR_ENGAGED persistence FAILED for lead {lead_id}: {result.get('error')}")
+        logger.error("❌ SDR_ENGAGED persistence FAILED for lead %s: %s", lead_id, result.get('error'))
     
     return result
 
@@ -607,11 +1215,11 @@ async def persist_lead_converting(
         logger.warning("⏭️ persist_lead_converting: No lead_id provided, skipping")
         return {"success": False, "error": "No lead_id provided", "skipped": True}
     
-    logger.info(f"🔔 PERSIST EVENT: CONVERTING (CONFIRMED) for lead {lead_id}")
+    logger.info("🔔 PERSIST EVENT: CONVERTING (CONFIRMED) for lead %s", lead_id)
     service = get_bigquery_service()
     
     if not service.is_available():
-        logger.error(f"❌ BigQuery not available - CANNOT persist confirmed lead {lead_id}!")
+        logger.error("❌ BigQuery not available - CANNOT persist confirmed lead %s!", lead_id)
         return {"success": False, "error": "BigQuery not available", "skipped": True}
     
     result = await service.persist_lead_status(
@@ -624,9 +1232,9 @@ async def persist_lead_converting(
     )
     
     if result.get("success"):
-        logger.info(f"✅ CONVERTING persisted successfully for lead {lead_id}")
+        logger.info("✅ CONVERTING persisted successfully for lead %s", lead_id)
     else:
-        logger.error(f"❌ CONVERTING persistence FAILED for lead {lead_id}: {result.get('error')}")
+        logger.error("❌ CONVERTING persistence FAILED for lead %s: %s", lead_id, result.get('error'))
     
     return result
 
@@ -648,13 +1256,12 @@ async def persist_meeting_scheduled(
         logger.warning("⏭️ persist_meeting_scheduled: No lead_id provided, skipping")
         return {"success": False, "error": "No lead_id provided", "skipped": True}
     
-    logger.info(f"🔔 PERSIST EVENT: MEETING_SCHEDULED for lead {lead_id}")
-    logger.info(f"   Meeting details: {meeting_details}")
+    logger.info("🔔 PERSIST EVENT: MEETING_SCHEDULED for lead %s (meeting details: %s)", lead_id, meeting_details)
     
     service = get_bigquery_service()
     
     if not service.is_available():
-        logger.error(f"❌ BigQuery not available - CANNOT persist meeting for lead {lead_id}!")
+        logger.error("❌ BigQuery not available - CANNOT persist meeting for lead %s!", lead_id)
         return {"success": False, "error": "BigQuery not available", "skipped": True}
     
     result = await service.persist_lead_status(
@@ -667,8 +1274,8 @@ async def persist_meeting_scheduled(
     )
     
     if result.get("success"):
-        logger.info(f"✅ MEETING_SCHEDULED persisted successfully for lead {lead_id}")
+        logger.info("✅ MEETING_SCHEDULED persisted successfully for lead %s", lead_id)
     else:
-        logger.error(f"❌ MEETING_SCHEDULED persistence FAILED for lead {lead_id}: {result.get('error')}")
+        logger.error("❌ MEETING_SCHEDULED persistence FAILED for lead %s: %s", lead_id, result.get('error'))
     
     return result
@@ -4,30 +4,314 @@ Finds businesses WITHOUT websites - these are prime leads for web development se
 Based on Lead Finder README specifications.
 """
 
+import asyncio
+import atexit
+import hashlib
+import json
 import logging
+import math
 import os
-from typing import Dict, Any, List, Optional
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 
+try:
+    import googlemaps
+    import requests
+    from requests.adapters import HTTPAdapter
+    GOOGLEMAPS_AVAILABLE = True
+except ImportError:
+    GOOGLEMAPS_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP/2 for the shared Gemini client (optional - needs h2)
+from .http2_support import HTTP2_AVAILABLE
+
 # Load environment variables
 load_dotenv()
 
+# Markdown code fence around Gemini's JSON reply (```json ... ```)
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
 logger = logging.getLogger(__name__)
 
 # Get API key directly from environment
 GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY", "")
 
+# Place Details fields needed to build a lead
+PLACE_FIELDS = (
+    'name', 'formatted_address', 'formatted_phone_number',
+    'international_phone_number',
+    'website', 'rating', 'user_ratings_total', 'price_level',
+    'opening_hours', 'business_status', 'geometry', 'types'
+)
+
+# Business types to search - focus on local businesses likely needing websites.
+# The legacy Nearby Search endpoint takes a single type per request, so each
+# type is its own (concurrent) call; overlaps are deduped by place_id.
+BUSINESS_TYPES = (
+    "restaurant",
+    "cafe", 
+    "bakery",
+    "hair_care",
+    "beauty_salon",
+    "gym",
+    "dentist",
+    "doctor",
+    "plumber",
+    "electrician",
+    "car_repair",
+    "real_estate_agency",
+    "store",
+    "florist",
+    "pet_store"
+)
+
+# Concurrent Place Details requests; the HTTP pool is sized to match
+DETAILS_WORKERS = int(os.getenv("PLACES_DETAILS_WORKERS", "16"))
+HTTP_POOL_SIZE = 32
+
+# Place Details change on the scale of days; cache them per place_id
+DETAILS_CACHE_TTL_SECONDS = 24 * 3600
+DETAILS_CACHE_MAX_ENTRIES = 50_000
+
+# place_id -> (expires_at, details)
+_details_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_details_cache_lock = threading.Lock()
+
+# City geocodes barely change, so cache them across searches and restarts
+GEOCODE_CACHE_PATH = Path(os.getenv(
+    "GEOCODE_CACHE_PATH",
+    str(Path.home() / ".cache" / "leadpilot" / "geocode.json"),
+))
+GEOCODE_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# normalized city -> (lat, lng, cached_at)
+_geo_cache: Optional[Dict[str, Tuple[float, float, float]]] = None
+_geo_cache_lock = threading.Lock()
+
+# Negative cache: places verified to HAVE a website are skipped for a week
+WEBSITE_CACHE_PATH = Path(os.getenv(
+    "WEBSITE_CACHE_PATH",
+    str(Path.home() / ".cache" / "leadpilot" / "has_website.json"),
+))
+WEBSITE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# place_id -> cached_at
+_has_website: Optional[Dict[str, float]] = None
+_has_website_dirty = False
+_has_website_lock = threading.Lock()
+
+
+def _read_json_cache(path: Path) -> Dict[str, Any]:
+    """Read a JSON cache file; a missing or corrupt file is an empty cache."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json_cache(path: Path, cache: Dict[str, Any]):
+    """Atomically write a JSON cache file; failures only cost future lookups."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Could not persist cache %s: %s", path, e)
+
+
+def _load_geo_cache() -> Dict[str, Tuple[float, float, float]]:
+    """Load the on-disk geocode cache, dropping expired entries."""
+    cutoff = time.time() - GEOCODE_CACHE_TTL_SECONDS
+    raw = _read_json_cache(GEOCODE_CACHE_PATH)
+    return {city: tuple(entry) for city, entry in raw.items() if entry[2] > cutoff}
+
+
+def _save_geo_cache(cache: Dict[str, Tuple[float, float, float]]):
+    """Write the geocode cache to disk."""
+    _write_json_cache(GEOCODE_CACHE_PATH, cache)
+
+
+def _get_has_website() -> Dict[str, float]:
+    """Return the "has website" negative cache, loading it on first use."""
+    global _has_website
+    with _has_website_lock:
+        if _has_website is None:
+            cutoff = time.time() - WEBSITE_CACHE_TTL_SECONDS
+            raw = _read_json_cache(WEBSITE_CACHE_PATH)
+            _has_website = {pid: ts for pid, ts in raw.items() if ts > cutoff}
+    return _has_website
+
+
+def _mark_has_website(place_id: str):
+    """Remember that a place has a website (persisted by _save_has_website)."""
+    global _has_website_dirty
+    with _has_website_lock:
+        _has_website[place_id] = time.time()
+        _has_website_dirty = True
+
+
+def _save_has_website():
+    """Write the negative cache to disk if it changed."""
+    global _has_website_dirty
+    with _has_website_lock:
+        if not _has_website_dirty:
+            return
+        _write_json_cache(WEBSITE_CACHE_PATH, _has_website)
+        _has_website_dirty = False
+
+
+# Optional cross-search "already delivered" filter. When set, places returned
+# by earlier searches (in this or previous runs) are skipped before their
+# details are fetched. Unset by default: repeat searches return the same leads.
+SEEN_FILTER_PATH = os.getenv("PLACES_SEEN_FILTER_PATH", "")
+SEEN_FILTER_CAPACITY = int(os.getenv("PLACES_SEEN_FILTER_CAPACITY", "1000000"))
+SEEN_FILTER_ERROR_RATE = 1e-7
+
+
+def _preview(names, limit: int = 10) -> str:
+    """Comma-join the first few names for a summary log line."""
+    names = [str(n) for n in names]
+    more = f" (+{len(names) - limit} more)" if len(names) > limit else ""
+    return ", ".join(names[:limit]) + more
+
+
+def _location_of(place_info: Dict[str, Any], place: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the {'lat', 'lng'} of a place, preferring details over the nearby summary."""
+    geometry = place_info.get('geometry') or place.get('geometry')
+    if not geometry:
+        return {}
+    return geometry.get('location') or {}
+
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9 ]+")
+_NON_DIGIT_RE = re.compile(r"\D+")
+_NAME_SUFFIXES = frozenset({"llc", "inc", "ltd", "co", "corp", "company", "pvt", "the"})
+
+
+def _business_key(name: str, phone: str, loc: Dict[str, Any]) -> str:
+    """
+    Canonical identity of a business independent of its place_id.
+    
+    "Joe's Pizza" and "Joes Pizza LLC" at the same spot with the same phone
+    map to the same key.
+    """
+    words = _NON_ALNUM_RE.sub("", name.lower().replace("&", " and ")).split()
+    norm_name = " ".join(w for w in words if w not in _NAME_SUFFIXES)
+    phone_digits = _NON_DIGIT_RE.sub("", phone or "")[-10:]
+    lat, lng = loc.get('lat'), loc.get('lng')
+    coords = f"{lat:.3f},{lng:.3f}" if lat is not None and lng is not None else ""
+    return f"{norm_name}|{phone_digits}|{coords}"
+
+
+class _BloomFilter:
+    """
+    Fixed-size Bloom filter over strings, persisted as a raw bit array.
+    
+    About 4 bytes per entry at a 1e-7 false-positive rate, versus ~200 bytes
+    for a place_id in a Python set.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    def _positions(self, item: str):
+        # Enhanced double hashing over one 128-bit digest (plain double
+        # hashing correlates probes and inflates the false-positive rate)
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        m = self.num_bits
+        h1 = int.from_bytes(digest[:8], "little") % m
+        h2 = int.from_bytes(digest[8:], "little") % m
+        return [(h1 + i * h2 + (i * i * i - i) // 6) % m for i in range(self.num_hashes)]
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def add(self, item: str):
+        positions = self._positions(item)
+        with self._lock:
+            for pos in positions:
+                self.bits[pos >> 3] |= 1 << (pos & 7)
+            self.dirty = True
+
+    def load(self, path: str):
+        """Load bits from path; ignored if missing or sized for another capacity."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return
+        if len(data) == len(self.bits):
+            self.bits[:] = data
+
+    def save(self, path: str):
+        """Write the bit array to path if anything was added."""
+        if not self.dirty:
+            return
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with self._lock, open(tmp_path, "wb") as f:
+                f.write(self.bits)
+            os.replace(tmp_path, path)
+            self.dirty = False
+        except OSError as e:
+            logger.warning("Could not persist seen-places filter: %s", e)
+
+
+_seen_filter: Optional[_BloomFilter] = None
+_seen_filter_lock = threading.Lock()
+
+
+def _get_seen_filter() -> Optional[_BloomFilter]:
+    """Return the persistent seen-places filter, or None when disabled."""
+    global _seen_filter
+    if not SEEN_FILTER_PATH:
+        return None
+    with _seen_filter_lock:
+        if _seen_filter is None:
+            _seen_filter = _BloomFilter(SEEN_FILTER_CAPACITY, SEEN_FILTER_ERROR_RATE)
+            _seen_filter.load(SEEN_FILTER_PATH)
+            atexit.register(_seen_filter.save, SEEN_FILTER_PATH)
+    return _seen_filter
+
+
 class DirectGoogleMapsSearch:
     """
     Direct Google Maps API client for fast business searches.
     Focuses on finding businesses WITHOUT websites (prime leads).
+    
+    Concurrency: the googlemaps client is synchronous, so nearby searches and
+    Place Details lookups fan out over a shared thread pool and pooled HTTP
+    session rather than an async client. This keeps googlemaps' retry and
+    QPS rate limiting in place; callers on the event loop run a search via
+    a worker thread (see direct_search_businesses).
     """
 
     def __init__(self):
         self.client = None
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._initialized = False
-        logger.info(f"DirectGoogleMapsSearch init - API Key available: {bool(GOOGLE_MAPS_API_KEY)}")
+        logger.info("DirectGoogleMapsSearch init - API Key available: %s", bool(GOOGLE_MAPS_API_KEY))
         
     def _ensure_client(self):
         """Lazily initialize the Google Maps client."""
@@ -39,19 +323,89 @@ class DirectGoogleMapsSearch:
         if not GOOGLE_MAPS_API_KEY:
             logger.error("GOOGLE_MAPS_API_KEY not set in environment")
             return False
+        
+        if not GOOGLEMAPS_AVAILABLE:
+            logger.error("googlemaps library not installed. Please install: pip install googlemaps")
+            return False
             
         try:
-            import googlemaps
-            self.client = googlemaps.Client(key=GOOGLE_MAPS_API_KEY)
-            # Test with a simple geocode
-            self.client.geocode("New York")
+            # Pooled session so concurrent detail lookups reuse connections
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            self.client = googlemaps.Client(key=GOOGLE_MAPS_API_KEY, requests_session=session)
+            self._executor = ThreadPoolExecutor(
+                max_workers=DETAILS_WORKERS, thread_name_prefix="places"
+            )
+            # No test request here: the first real call surfaces auth errors
             logger.info("Google Maps client initialized successfully")
             return True
         except Exception as e:
-            logger.error(f"Failed to initialize Google Maps client: {e}")
+            logger.error("Failed to initialize Google Maps client: %s", e)
             self.client = None
             return False
 
+    def _geocode_city(self, city: str) -> Optional[Dict[str, float]]:
+        """
+        Resolve a city to {'lat', 'lng'}, using the persistent geocode cache.
+        
+        Only cache misses (or entries older than 30 days) hit the Geocoding API.
+        """
+        global _geo_cache
+        key = city.strip().lower()
+        with _geo_cache_lock:
+            if _geo_cache is None:
+                _geo_cache = _load_geo_cache()
+            entry = _geo_cache.get(key)
+        if entry and entry[2] > time.time() - GEOCODE_CACHE_TTL_SECONDS:
+            return {"lat": entry[0], "lng": entry[1]}
+        
+        geocode_result = self.client.geocode(city)
+        if not geocode_result:
+            return None
+        location = geocode_result[0]['geometry']['location']
+        
+        with _geo_cache_lock:
+            _geo_cache[key] = (location['lat'], location['lng'], time.time())
+            _save_geo_cache(_geo_cache)
+        return location
+
+    def _get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch Place Details for one place (cached for a day); None if the lookup fails."""
+        now = time.monotonic()
+        cached = _details_cache.get(place_id)
+        if cached and cached[0] > now:
+            return cached[1]
+        
+        try:
+            details_result = self.client.place(place_id=place_id, fields=PLACE_FIELDS)
+        except Exception as e:
+            logger.debug("Could not get details for %s: %s", place_id, e)
+            return None
+        
+        place_info = details_result.get('result', {})
+        if place_info:
+            with _details_cache_lock:
+                if len(_details_cache) >= DETAILS_CACHE_MAX_ENTRIES:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    _details_cache.pop(next(iter(_details_cache)), None)
+                _details_cache[place_id] = (now + DETAILS_CACHE_TTL_SECONDS, place_info)
+        return place_info
+
+    def _fetch_details_batch(self, place_ids: List[str]) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Yield Place Details for place_ids in order, all fetched concurrently.
+        
+        Closing the iterator early cancels lookups that have not started.
+        """
+        futures = [self._executor.submit(self._get_place_details, pid) for pid in place_ids]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
     def search_businesses(
         self, 
         city: str, 
@@ -75,112 +429,144 @@ class DirectGoogleMapsSearch:
             
         try:
             # Get city coordinates
-            geocode_result = self.client.geocode(city)
-            if not geocode_result:
-                logger.error(f"Could not geocode city: {city}")
+            location = self._geocode_city(city)
+            if not location:
+                logger.error("Could not geocode city: %s", city)
                 return []
                 
-            location = geocode_result[0]['geometry']['location']
-            logger.info(f"Geocoded {city} to lat={location['lat']}, lng={location['lng']}")
+            logger.info("Geocoded %s to lat=%s, lng=%s", city, location['lat'], location['lng'])
             
-            # Business types to search - focus on local businesses likely needing websites
-            business_types = [
-                "restaurant",
-                "cafe", 
-                "bakery",
-                "hair_care",
-                "beauty_salon",
-                "gym",
-                "dentist",
-                "doctor",
-                "plumber",
-                "electrician",
-                "car_repair",
-                "real_estate_agency",
-                "store",
-                "florist",
-                "pet_store"
-            ]
+            business_types = BUSINESS_TYPES
+            # One timestamp for the whole batch
+            now_iso = datetime.now().isoformat()
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            
+            # Per-place outcomes are collected and logged once per search
+            nearby_total = 0
+            skipped_with_website: List[str] = []
+            unverified: List[str] = []
             
             all_businesses = []
+            # Per-search dedup stays a set; the Bloom filter is the cross-search tier
             seen_place_ids = set()
+            seen_business_keys = set()
+            seen_filter = _get_seen_filter()
+            has_website = _get_has_website() if exclude_with_websites else None
             
-            for biz_type in business_types:
+            # Use places_nearby for each type, all types in flight at once;
+            # results are merged in business_types order below
+            nearby_futures = [
+                self._executor.submit(
+                    self.client.places_nearby,
+                    location=location,
+                    radius=25000,  # 25km radius as per README
+                    type=biz_type
+                )
+                for biz_type in business_types
+            ]
+            
+            for biz_type, nearby_future in zip(business_types, nearby_futures):
                 if len(all_businesses) >= max_results:
                     break
                     
                 try:
-                    # Use places_nearby for each type
-                    result = self.client.places_nearby(
-                        location=location,
-                        radius=25000,  # 25km radius as per README
-                        type=biz_type
-                    )
+                    result = nearby_future.result()
                     
                     places = result.get('results', [])
-                    logger.info(f"Found {len(places)} {biz_type} businesses in {city}")
+                    nearby_total += len(places)
+                    if debug_enabled:
+                        logger.debug("Found %s %s businesses in %s", len(places), biz_type, city)
                     
+                    candidates = []
                     for place in places:
-                        if len(all_businesses) >= max_results:
-                            break
-                            
                         place_id = place.get('place_id')
                         if not place_id or place_id in seen_place_ids:
                             continue
                         seen_place_ids.add(place_id)
+                        if seen_filter is not None and place_id in seen_filter:
+                            continue
                         
-                        # Try to get detailed place info to check website
-                        # The places_nearby API does NOT return website info
-                        place_info = None
-                        got_details = False
-                        try:
-                            details_result = self.client.place(
-                                place_id=place_id,
-                                fields=[
-                                    'name', 'formatted_address', 'formatted_phone_number',
-                                    'international_phone_number',
-                                    'website', 'rating', 'user_ratings_total', 'price_level',
-                                    'opening_hours', 'business_status', 'geometry', 'types'
-                                ]
-                            )
-                            place_info = details_result.get('result', {})
-                            if place_info and place_info.get('name'):
-                                got_details = True
-                                logger.debug(f"Got details for {place_info.get('name')}")
-                        except Exception as e:
-                            logger.debug(f"Could not get details for {place_id}: {e}")
+                        # Known to have a website from an earlier search
+                        if has_website is not None:
+                            cached_at = has_website.get(place_id)
+                            if cached_at and cached_at > time.time() - WEBSITE_CACHE_TTL_SECONDS:
+                                continue
                         
-                        # If details API failed, use basic info and INCLUDE the business
-                        # (we're looking for businesses WITHOUT websites - if we can't verify
-                        # they HAVE one, include them as potential leads)
-                        if not got_details:
-                            place_info = place.copy()
-                            place_info['website'] = ''  # Assume no website
-                            logger.info(f"Including {place.get('name')} - no website info available (likely no website)")
+                        # Apply the rating/review filters to the nearby summary
+                        # first, so rejects never cost a Place Details call
+                        if place.get('business_status') == 'CLOSED_PERMANENTLY':
+                            continue
+                        nearby_rating = place.get('rating', 0)
+                        if nearby_rating and nearby_rating < 3.0:
+                            continue
+                        nearby_reviews = place.get('user_ratings_total', 0)
+                        if nearby_reviews and nearby_reviews < 5:
+                            continue
                         
-                        # Website check
-                        website = place_info.get('website', '')
+                        candidates.append(place)
+                    
+                    # The places_nearby API does NOT return website info, so
+                    # fetch detailed place info for all candidates in one batch
+                    details = self._fetch_details_batch([place['place_id'] for place in candidates])
+                    
+                    for place, place_info in zip(candidates, details):
+                        if len(all_businesses) >= max_results:
+                            break
+                            
+                        place_id = place['place_id']
+                        got_details = False
+                        if place_info and place_info.get('name'):
+                            got_details = True
+                            if debug_enabled:
+                                logger.debug("Got details for %s", place_info['name'])
                         
-                        # Filter: exclude businesses WITH websites
-                        if exclude_with_websites and got_details:
-                            if website and len(website.strip()) > 0:
+                        if got_details:
+                            website = place_info.get('website') or ''
+                            # Filter: exclude businesses WITH websites
+                            if exclude_with_websites and website.strip():
                                 # Has a website - skip this lead
-                                logger.info(f"SKIPPING: {place_info.get('name')} - HAS WEBSITE: {website}")
+                                skipped_with_website.append(place_info.get('name'))
+                                if debug_enabled:
+                                    logger.debug("SKIPPING: %s - HAS WEBSITE: %s", place_info.get('name'), website)
+                                _mark_has_website(place_id)
                                 continue
+                        else:
+                            # If details API failed, use basic info and INCLUDE the business
+                            # (we're looking for businesses WITHOUT websites - if we can't verify
+                            # they HAVE one, include them as potential leads). The candidate
+                            # is already a private copy, so it is used as-is.
+                            place_info = place
+                            website = ''  # Assume no website
+                            unverified.append(place.get('name'))
                         
                         # Check rating filter (minimum 3.0 as per README)
                         rating = place_info.get('rating', 0)
-                        if rating > 0 and rating < 3.0:
+                        if 0 < rating < 3.0:
                             continue
                             
                         # Check review count (minimum 5 reviews as per README)
                         review_count = place_info.get('user_ratings_total', 0)
-                        if review_count > 0 and review_count < 5:
+                        if 0 < review_count < 5:
+                            continue
+                        
+                        # Only build a lead if we have valid basic info
+                        name = place_info.get('name') or place.get('name')
+                        if not name or name == "Unknown":
                             continue
                         
                         # Get location coordinates
-                        geometry = place_info.get('geometry', place.get('geometry', {}))
-                        loc = geometry.get('location', {})
+                        loc = _location_of(place_info, place)
+                        
+                        # Contact information (prefer international format)
+                        phone = place_info.get('international_phone_number') or place_info.get('formatted_phone_number', '')
+                        
+                        # Near-duplicates listed under different place_ids
+                        business_key = _business_key(name, phone, loc)
+                        if business_key in seen_business_keys:
+                            continue
+                        if seen_filter is not None and f"key:{business_key}" in seen_filter:
+                            continue
+                        seen_business_keys.add(business_key)
                         
                         # Build comprehensive business object matching README schema
                         business = {
@@ -189,11 +575,11 @@ class DirectGoogleMapsSearch:
                             "place_id": place_id,
                             
                             # Business identity
-                            "name": place_info.get('name', place.get('name', 'Unknown')),
+                            "name": name,
                             "address": place_info.get('formatted_address', place.get('vicinity', '')),
                             
                             # Contact information (prefer international format)
-                            "phone": place_info.get('international_phone_number') or place_info.get('formatted_phone_number', ''),
+                            "phone": phone,
                             "international_phone": place_info.get('international_phone_number', ''),
                             "website": website or None,  # None for leads without websites
                             
@@ -218,24 +604,44 @@ class DirectGoogleMapsSearch:
                             # Lead metadata
                             "search_type": "google_maps",
                             "lead_status": "new",
-                            "created_at": datetime.now().isoformat(),
-                            "updated_at": datetime.now().isoformat()
+                            "created_at": now_iso,
+                            "updated_at": now_iso
                         }
                         
-                        # Only add if we have valid basic info
-                        if business["name"] and business["name"] != "Unknown":
-                            all_businesses.append(business)
-                            logger.info(f"✓ VERIFIED NO WEBSITE: {business['name']} ({biz_type})")
+                        all_businesses.append(business)
+                        if seen_filter is not None:
+                            seen_filter.add(place_id)
+                            seen_filter.add(f"key:{business_key}")
+                        if debug_enabled:
+                            logger.debug("✓ VERIFIED NO WEBSITE: %s (%s)", business['name'], biz_type)
+                    
+                    # Lookups not yet started are no longer needed
+                    details.close()
                             
                 except Exception as e:
-                    logger.warning(f"Error searching for {biz_type} in {city}: {e}")
+                    logger.warning("Error searching for %s in %s: %s", biz_type, city, e)
                     continue
+            
+            for nearby_future in nearby_futures:
+                nearby_future.cancel()
+            if has_website is not None:
+                _save_has_website()
                     
-            logger.info(f"Total VERIFIED leads in {city}: {len(all_businesses)} (all verified to have NO website)")
+            logger.info(
+                "Total VERIFIED leads in %s: %s from %s nearby results (all verified to have NO website): %s",
+                city, len(all_businesses), nearby_total, _preview(b['name'] for b in all_businesses),
+            )
+            if skipped_with_website:
+                logger.info("Skipped %s places WITH websites: %s", len(skipped_with_website), _preview(skipped_with_website))
+            if unverified:
+                logger.info(
+                    "Included %s places without website info (likely no website): %s",
+                    len(unverified), _preview(unverified),
+                )
             return all_businesses
             
         except Exception as e:
-            logger.error(f"Error searching businesses in {city}: {e}")
+            logger.error("Error searching businesses in %s: %s", city, e)
             return []
 
 
@@ -250,13 +656,37 @@ def get_direct_search() -> DirectGoogleMapsSearch:
     return _search_instance
 
 
+# Shared Gemini HTTP client: reuses TLS connections across fallback calls.
+# Created on first use inside the running loop; closed by close_gemini_client().
+_gemini_client = None
+
+
+def _get_gemini_client():
+    """Return the shared httpx.AsyncClient for Gemini calls, creating it if needed."""
+    global _gemini_client
+    if _gemini_client is None or _gemini_client.is_closed:
+        import httpx
+        _gemini_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+            http2=HTTP2_AVAILABLE,
+        )
+    return _gemini_client
+
+
+async def close_gemini_client():
+    """Close the shared Gemini client (call on application shutdown)."""
+    global _gemini_client
+    if _gemini_client is not None:
+        await _gemini_client.aclose()
+        _gemini_client = None
+
+
 async def generate_leads_with_gemini(city: str, max_results: int = 20) -> List[Dict[str, Any]]:
     """
     Generate sample business leads using Google Gemini API.
     Fallback when Google Maps API is not available.
     """
-    import httpx
-    import json
     import uuid
     
     GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
@@ -287,62 +717,58 @@ Make names sound authentic and local to {city}.
 Return ONLY the JSON array, no other text."""
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-lite:generateContent?key={GOOGLE_API_KEY}",
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {"temperature": 0.8}
-                }
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Gemini API error: {response.status_code} - {response.text}")
-                return []
-            
-            data = response.json()
-            text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
-            
-            # Extract JSON from response
-            text = text.strip()
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-            
-            businesses_data = json.loads(text)
-            
-            # Format businesses properly
-            businesses = []
-            for biz in businesses_data[:max_results]:
-                businesses.append({
-                    "id": str(uuid.uuid4()),
-                    "name": biz.get("name", "Unknown Business"),
-                    "category": biz.get("category", "local_business"),
-                    "phone": biz.get("phone", ""),
-                    "address": biz.get("address", city),
-                    "city": city,
-                    "website": None,
-                    "has_website": False,
-                    "rating": round(3.5 + (hash(biz.get("name", "")) % 15) / 10, 1),
-                    "review_count": 10 + (hash(biz.get("name", "")) % 200),
-                    "lead_score": 70 + (hash(biz.get("name", "")) % 25),
-                    "source": "gemini_generated",
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat()
-                })
-            
-            logger.info(f"Generated {len(businesses)} leads using Gemini for {city}")
-            return businesses
-            
+        client = _get_gemini_client()
+        response = await client.post(
+            f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-lite:generateContent?key={GOOGLE_API_KEY}",
+            json={
+                "contents": [{"parts": [{"text": prompt}]}],
+                "generationConfig": {"temperature": 0.8}
+            }
+        )
+        
+        if response.status_code != 200:
+            logger.error("Gemini API error: %s - %s", response.status_code, response.text)
+            return []
+        
+        data = _json_loads(response.content)
+        text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
+        
+        # Extract JSON from response
+        text = _FENCE_RE.sub("", text.strip()).strip()
+        
+        businesses_data = _json_loads(text)
+        
+        # Format businesses properly
+        businesses = []
+        now_iso = datetime.now().isoformat()
+        for biz in businesses_data[:max_results]:
+            name = biz.get("name", "")
+            name_hash = hash(name)
+            businesses.append({
+                "id": str(uuid.uuid4()),
+                "name": biz.get("name", "Unknown Business"),
+                "category": biz.get("category", "local_business"),
+                "phone": biz.get("phone", ""),
+                "address": biz.get("address", city),
+                "city": city,
+                "website": None,
+                "has_website": False,
+                "rating": round(3.5 + (name_hash % 15) / 10, 1),
+                "review_count": 10 + (name_hash % 200),
+                "lead_score": 70 + (name_hash % 25),
+                "source": "gemini_generated",
+                "created_at": now_iso,
+                "updated_at": now_iso
+            })
+        
+        logger.info("Generated %s leads using Gemini for %s", len(businesses), city)
+        return businesses
+        
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse Gemini response as JSON: {e}")
+        logger.error("Failed to parse Gemini response as JSON: %s", e)
         return []
     except Exception as e:
-        logger.error(f"Error generating leads with Gemini: {e}")
+        logger.error("Error generating leads with Gemini: %s", e)
         return []
 
 
@@ -358,16 +784,10 @@ async def direct_search_businesses(city: str, max_results: int = 20) -> Dict[str
     Returns:
         Result dict with success status and businesses list
     """
-    import asyncio
-    
     search = get_direct_search()
     
-    # Run sync function in thread pool
-    loop = asyncio.get_event_loop()
-    businesses = await loop.run_in_executor(
-        None, 
-        lambda: search.search_businesses(city, max_results, exclude_with_websites=True)
-    )
+    # Run the blocking search in a worker thread
+    businesses = await asyncio.to_thread(search.search_businesses, city, max_results, True)
     
     # FALLBACK: If Google Maps search fails, use Gemini to generate sample leads
     if not businesses:
@@ -6,22 +6,33 @@ Monitors Gmail inbox for replies to sent proposals and automatically
 confirms leads when positive responses are detected.
 
 Features:
-- IMAP-based email polling
+- IMAP-based email tracking over one persistent connection (IDLE push
+  where supported, polling otherwise)
 - Keyword detection (YES, INTERESTED, CONFIRM, etc.)
 - Reference code matching for accurate lead identification
 - Real-time WebSocket notifications
 """
 
 import asyncio
+import functools
+import html
 import imaplib
 import email
 from email.header import decode_header
+from email import policy
+from email.parser import BytesHeaderParser
 import logging
 import os
 import re
-from datetime import datetime, timedelta
+import socket
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Callable, Any
-import hashlib
+import json
+from pathlib import Path
+
+from .reference_codes import generate_reference_code
 
 logger = logging.getLogger("EmailTracker")
 
@@ -39,6 +50,100 @@ NEGATIVE_KEYWORDS = [
 ]
 
 
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern":
+    """Compile keywords into one whole-word alternation, longest phrase first."""
+    alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+# Clear indicators count double when weighing a reply
+STRONG_KEYWORDS = {"yes", "interested", "confirm", "no", "unsubscribe"}
+
+# Both polarities share one pattern so the body is scanned once; each hit is
+# mapped to a signed weight. Whole-word matching keeps "ok" from firing
+# inside "booking", and longest-first lets "not interested" beat "interested".
+_KEYWORD_WEIGHT: Dict[str, int] = {
+    **{kw: 2 if kw in STRONG_KEYWORDS else 1 for kw in POSITIVE_KEYWORDS},
+    **{kw: -2 if kw in STRONG_KEYWORDS else -1 for kw in NEGATIVE_KEYWORDS},
+}
+_KEYWORD_RE = _keyword_pattern(list(_KEYWORD_WEIGHT))
+
+# Start of the quoted history in a reply ("On ... wrote:", Outlook's
+# "Original Message" divider, an underscore rule or a ">" quoted line).
+# Everything from here down is our own proposal and must not be scored.
+_QUOTE_RE = re.compile(
+    r"^(?:On\s[\s\S]{0,200}?wrote:|-{2,}\s*Original Message\s*-{2,}|_{5,}|>)",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# HTML-only replies: the quoted history starts at the first <blockquote>
+# or at the client's quote container (Gmail, Thunderbird, Outlook)
+_HTML_QUOTE_RE = re.compile(
+    r'<blockquote|<div[^>]*(?:gmail_quote|moz-cite-prefix|divRplyFwdMsg)',
+    re.IGNORECASE,
+)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# New content of a reply sits at the top; only this much is scored
+ANALYZE_MAX_CHARS = 2048
+
+# Hard cap on body text scanned for lead mentions and proposal markers,
+# independent of how much of the message the IMAP fetch returned
+BODY_SCAN_MAX_CHARS = 8192
+
+# Upper bound for one IDLE wait before re-checking (RFC 2177 asks clients to
+# re-issue IDLE within 29 minutes; shorter bounds latency if a push is missed)
+IDLE_TIMEOUT_SECONDS = int(os.getenv("EMAIL_IDLE_TIMEOUT", "300"))
+
+# Highest processed UID is persisted here so restarts resume where they left off
+STATE_PATH = Path(os.getenv(
+    "EMAIL_TRACKER_STATE_PATH",
+    str(Path.home() / ".cache" / "leadpilot" / "email_tracker.json"),
+))
+
+# Fetch only the headers we read plus the first 4KB of the body. PEEK leaves
+# the \Seen flag alone so the user's inbox state is unchanged. Content-type
+# headers are included so the truncated body can still be MIME-decoded.
+FETCH_PARTS = (
+    "(BODY.PEEK[HEADER.FIELDS (SUBJECT FROM MESSAGE-ID IN-REPLY-TO REFERENCES "
+    "MIME-VERSION CONTENT-TYPE CONTENT-TRANSFER-ENCODING)] BODY.PEEK[TEXT]<0.4096>)"
+)
+
+# imaplib gained IDLE support in Python 3.14
+IMAPLIB_HAS_IDLE = hasattr(imaplib.IMAP4, "idle")
+
+
+@functools.lru_cache(maxsize=2048)
+def _decode_header(header_value: str) -> str:
+    """Decode an RFC 2047 email header value (cached; threads repeat Subject/From)."""
+    if not header_value:
+        return ""
+    
+    parts = []
+    for part, encoding in decode_header(header_value):
+        if isinstance(part, bytes):
+            parts.append(part.decode(encoding or "utf-8", errors="ignore"))
+        else:
+            parts.append(part)
+    return "".join(parts)
+
+
+@dataclass(slots=True)
+class PendingLead:
+    """A lead whose proposal email is awaiting a reply."""
+    business_id: str
+    business_name: str
+    sent_at: str
+    business_data: dict = field(default_factory=dict)
+    user_info: dict = field(default_factory=dict)
+    status: str = "pending"
+    confirmed_at: Optional[str] = None
+    confirmed_by: Optional[str] = None
+    response_body: Optional[str] = None
+    rejected_at: Optional[str] = None
+    rejected_by: Optional[str] = None
+
+
 class EmailReplyTracker:
     """
     Tracks email replies and automatically confirms leads based on positive responses.
@@ -62,32 +167,74 @@ class EmailReplyTracker:
         
         self.is_running = False
         self._task = None
-        self._pending_leads: Dict[str, dict] = {}  # reference_code -> lead_info
-        self._processed_emails: set = set()  # Track already processed email IDs
+        self._pending_leads: Dict[str, PendingLead] = {}  # reference_code -> lead
+        # Lookup of reference codes and business names in reply text, rebuilt
+        # lazily after _pending_leads changes: (pattern, {lowered term: (is_code, code)})
+        self._match_index: Optional[tuple] = None
+        # UID-based incremental fetch: only messages above _last_uid are read.
+        # The state is only valid for one UIDVALIDITY of the mailbox.
+        self._uidvalidity: Optional[int] = None
+        self._last_uid = 0
+        self._load_state()
+        # SINCE search date, recomputed only when the day changes
+        self._date_since = ""
+        self._date_since_day: Optional[date] = None
+        
+        # Persistent IMAP connections: one for fetching, one parked in IDLE
+        self._mail: Optional[imaplib.IMAP4_SSL] = None
+        self._idle_mail: Optional[imaplib.IMAP4_SSL] = None
+        self._idle_supported = IMAPLIB_HAS_IDLE  # cleared if the server lacks IDLE
+        # IMAP work runs in worker threads; a forced check may overlap the loop's
+        self._mail_lock = threading.Lock()
+        # One check at a time end to end, so the UID cursor only moves after processing
+        self._check_lock = asyncio.Lock()
         
         logger.info(f"EmailReplyTracker initialized for {self.email_address}")
     
     def generate_reference_code(self, business_id: str) -> str:
         """Generate a unique reference code for a business."""
-        return hashlib.md5(f"{business_id}-confirm".encode()).hexdigest()[:8].upper()
+        return generate_reference_code(business_id)
     
     def register_pending_lead(self, business_id: str, business_name: str, business_data: dict = None, user_info: dict = None):
         """Register a lead as pending confirmation via email."""
         reference_code = self.generate_reference_code(business_id)
-        self._pending_leads[reference_code] = {
-            "business_id": business_id,
-            "business_name": business_name,
-            "business_data": business_data or {},
-            "user_info": user_info or {},
-            "sent_at": datetime.now().isoformat(),
-            "status": "pending"
-        }
+        self._pending_leads[reference_code] = PendingLead(
+            business_id=business_id,
+            business_name=business_name,
+            sent_at=datetime.now().isoformat(),
+            business_data=business_data or {},
+            user_info=user_info or {},
+        )
+        self._match_index = None
         logger.info(f"Registered pending lead: {business_name} (ref: {reference_code})")
         return reference_code
     
+    def _remove_pending_lead(self, reference_code: str):
+        """Drop a lead that is no longer awaiting a reply."""
+        if self._pending_leads.pop(reference_code, None) is not None:
+            self._match_index = None
+    
+    def _get_match_index(self) -> tuple:
+        """Build one pattern over all pending reference codes and business names."""
+        if self._match_index is None:
+            terms: Dict[str, tuple] = {}
+            for code in self._pending_leads:
+                terms[code.lower()] = (True, code)
+            for code, lead_info in self._pending_leads.items():
+                business_name = (lead_info.business_name or "").lower()
+                if business_name:
+                    terms.setdefault(business_name, (False, code))
+            pattern = None
+            if terms:
+                pattern = re.compile("|".join(
+                    re.escape(term) for term in sorted(terms, key=len, reverse=True)
+                ))
+            self._match_index = (pattern, terms)
+        return self._match_index
+    
     def get_pending_leads(self) -> Dict[str, dict]:
         """Get all pending leads awaiting confirmation."""
-        return self._pending_leads.copy()
+        return {code: asdict(lead) for code, lead in self._pending_leads.items()}
     
     async def start(self):
         """Start the background email checking task."""
@@ -106,154 +253,307 @@ class EmailReplyTracker:
     async def stop(self):
         """Stop the background email checking task."""
         self.is_running = False
+        # Wake a thread blocked in IDLE so it does not outlive the tracker
+        idle_mail = self._idle_mail
+        if idle_mail is not None:
+            try:
+                idle_mail.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
         if self._task:
             self._task.cancel()
             try:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        self._idle_mail = None
+        await asyncio.to_thread(self._close_mail)
         logger.info("Email reply tracking stopped")
     
     async def _check_emails_loop(self):
-        """Main loop that periodically checks for email replies."""
+        """Main loop: check for replies, then wait for new mail (IDLE) or poll."""
         while self.is_running:
             try:
                 await self._check_for_replies()
             except Exception as e:
                 logger.error(f"Error checking emails: {e}")
             
+            if self._pending_leads and self._idle_supported:
+                try:
+                    await asyncio.to_thread(self._wait_for_new_mail, IDLE_TIMEOUT_SECONDS)
+                    if self._idle_supported:
+                        continue
+                except Exception as e:
+                    if self.is_running:
+                        logger.warning(f"IMAP IDLE failed, falling back to polling: {e}")
+                    self._idle_mail = self._logout(self._idle_mail)
+            
             await asyncio.sleep(self.check_interval)
     
+    def _connect(self, sync_uidvalidity: bool = True) -> imaplib.IMAP4_SSL:
+        """Open an authenticated IMAP connection with INBOX selected.
+        
+        The SELECT response carries UIDVALIDITY, so the UID cursor is checked
+        here rather than with a STATUS on the selected mailbox every check.
+        The IDLE connection never reads UIDs and skips it.
+        """
+        mail = imaplib.IMAP4_SSL(self.imap_server)
+        mail.login(self.email_address, self.email_password)
+        mail.select("INBOX")
+        if sync_uidvalidity:
+            self._sync_uidvalidity(mail)
+        return mail
+    
+    def _get_date_since(self) -> str:
+        """IMAP date for yesterday, cached for the current day."""
+        today = date.today()
+        if self._date_since_day != today:
+            self._date_since = (today - timedelta(days=1)).strftime("%d-%b-%Y")
+            self._date_since_day = today
+        return self._date_since
+    
+    def _load_state(self):
+        """Restore UIDVALIDITY and the last processed UID from disk."""
+        try:
+            with open(STATE_PATH, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self._uidvalidity = state.get("uidvalidity")
+            self._last_uid = int(state.get("last_uid", 0))
+        except (OSError, ValueError):
+            pass
+    
+    def _save_state(self):
+        """Persist UIDVALIDITY and the last processed UID."""
+        try:
+            STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = STATE_PATH.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"uidvalidity": self._uidvalidity, "last_uid": self._last_uid}, f)
+            os.replace(tmp_path, STATE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not persist email tracker state: {e}")
+    
+    def _sync_uidvalidity(self, mail: imaplib.IMAP4_SSL):
+        """Reset the UID cursor if the mailbox's UIDVALIDITY changed.
+        
+        Must run right after SELECT, whose untagged response holds the value.
+        """
+        _, data = mail.response("UIDVALIDITY")
+        if not data or data[-1] is None:
+            return
+        uidvalidity = int(data[-1])
+        if uidvalidity != self._uidvalidity:
+            if self._uidvalidity is not None:
+                logger.info("INBOX UIDVALIDITY changed, rescanning recent emails")
+            self._uidvalidity = uidvalidity
+            self._last_uid = 0
+    
+    @staticmethod
+    def _split_fetch_response(msg_data: List) -> List:
+        """Regroup a multi-message FETCH response into one (meta, raw) tuple per message.
+        
+        Each message arrives as a header-fields tuple and a body-text tuple,
+        terminated by a closing b")" item.
+        """
+        messages = []
+        sections = []
+        for part in msg_data:
+            if isinstance(part, tuple):
+                sections.append(part)
+            elif sections:
+                messages.append((sections[0][0], b"".join(section[1] for section in sections)))
+                sections = []
+        if sections:
+            messages.append((sections[0][0], b"".join(section[1] for section in sections)))
+        return messages
+    
+    @staticmethod
+    def _logout(mail: Optional[imaplib.IMAP4_SSL]) -> None:
+        """Log out of a connection, ignoring errors from a dead socket."""
+        if mail is not None:
+            try:
+                mail.logout()
+            except Exception:
+                pass
+        return None
+    
+    def _close_mail(self):
+        """Log out the fetch connection once no check is using it."""
+        with self._mail_lock:
+            self._mail = self._logout(self._mail)
+    
+    def _get_connection(self) -> imaplib.IMAP4_SSL:
+        """Return the persistent IMAP connection, reconnecting if it went stale."""
+        if self._mail is not None:
+            try:
+                self._mail.noop()
+                return self._mail
+            except (imaplib.IMAP4.error, OSError):
+                self._mail = self._logout(self._mail)
+        self._mail = self._connect()
+        return self._mail
+    
+    def _wait_for_new_mail(self, timeout: int) -> bool:
+        """
+        Block in IMAP IDLE until the server announces new mail or timeout.
+        
+        Uses a dedicated connection so checks never interleave with IDLE.
+        If the server does not advertise IDLE, polling is used from then on.
+        """
+        if self._idle_mail is None:
+            self._idle_mail = self._connect(sync_uidvalidity=False)
+        if "IDLE" not in self._idle_mail.capabilities:
+            logger.info("IMAP server does not support IDLE, polling instead")
+            self._idle_supported = False
+            self._idle_mail = self._logout(self._idle_mail)
+            return False
+        with self._idle_mail.idle(duration=timeout) as idler:
+            for response_type, _ in idler:
+                if response_type == "EXISTS":
+                    return True
+        return False
+    
     async def _check_for_replies(self):
         """Check inbox for new replies and process them."""
         if not self._pending_leads:
             return  # No pending leads to track
         
-        try:
-            # Connect to IMAP server
-            mail = imaplib.IMAP4_SSL(self.imap_server)
-            mail.login(self.email_address, self.email_password)
-            mail.select("INBOX")
-            
-            # Search for recent emails (last 24 hours)
-            date_since = (datetime.now() - timedelta(days=1)).strftime("%d-%b-%Y")
-            
-            # Search for emails that could be replies to our proposals
-            # Look for emails with "Re:" in subject or containing our reference codes
-            status, messages = mail.search(None, f'(SINCE "{date_since}")')
-            
-            if status != "OK":
-                logger.warning("Failed to search inbox")
-                mail.close()
-                mail.logout()
-                return
-            
-            email_ids = messages[0].split()
-            logger.debug(f"Found {len(email_ids)} recent emails to check")
-            
-            for email_id in email_ids[-50:]:  # Check last 50 emails max
-                email_id_str = email_id.decode()
+        async with self._check_lock:
+            # Blocking imaplib calls run in a worker thread to keep the event loop free
+            messages, last_uid = await asyncio.to_thread(self._fetch_new_messages)
+            if messages:
+                await self._process_email_response(messages)
+            # Advance the cursor only once the batch was fetched and processed,
+            # so a failed FETCH is retried on the next check
+            if last_uid > self._last_uid:
+                self._last_uid = last_uid
+                await asyncio.to_thread(self._save_state)
+    
+    def _fetch_new_messages(self) -> tuple:
+        """Fetch messages that arrived since the last check.
+        
+        Returns ((meta, raw) tuples, highest UID fetched); the UID is 0
+        when nothing was fetched.
+        """
+        with self._mail_lock:
+            try:
+                # Reuse the authenticated IMAP connection across checks
+                mail = self._get_connection()
+                
+                if self._last_uid:
+                    # Only messages that arrived since the last processed one
+                    criteria = f"UID {self._last_uid + 1}:*"
+                else:
+                    # First run: look at recent emails (last 24 hours)
+                    criteria = f'(SINCE "{self._get_date_since()}")'
                 
-                # Skip already processed emails
-                if email_id_str in self._processed_emails:
-                    continue
+                # Search for emails that could be replies to our proposals
+                status, messages = mail.uid("search", None, criteria)
                 
-                # Fetch email
-                status, msg_data = mail.fetch(email_id, "(RFC822)")
                 if status != "OK":
-                    continue
+                    logger.warning("Failed to search inbox")
+                    return [], 0
                 
-                await self._process_email_response(msg_data)
+                # "n:*" always matches the newest message, so filter explicitly
+                uids = sorted(int(uid) for uid in messages[0].split())
+                uids = [uid for uid in uids if uid > self._last_uid][-50:]  # Check last 50 emails max
+                logger.debug(f"Found {len(uids)} new emails to check")
                 
-                # Mark as processed
-                self._processed_emails.add(email_id_str)
-            
-            mail.close()
-            mail.logout()
-            
-        except imaplib.IMAP4.error as e:
-            logger.error(f"IMAP error: {e}")
-        except Exception as e:
-            logger.error(f"Error checking emails: {e}")
-    
-    def _decode_header(self, header_value: str) -> str:
-        """Decode email header value."""
-        if not header_value:
-            return ""
-        
-        decoded_parts = decode_header(header_value)
-        result = ""
-        for part, encoding in decoded_parts:
-            if isinstance(part, bytes):
-                result += part.decode(encoding or "utf-8", errors="ignore")
-            else:
-                result += part
-        return result
+                if not uids:
+                    return [], 0
+                
+                # One round-trip for headers and the start of the body of every message
+                uid_set = ",".join(str(uid) for uid in uids)
+                status, msg_data = mail.uid("fetch", uid_set, FETCH_PARTS)
+                if status != "OK":
+                    logger.warning("Failed to fetch new emails")
+                    return [], 0
+                
+                return self._split_fetch_response(msg_data), uids[-1]
+                
+            except imaplib.IMAP4.error as e:
+                logger.error(f"IMAP error: {e}")
+                self._mail = self._logout(self._mail)
+            except Exception as e:
+                logger.error(f"Error checking emails: {e}")
+                self._mail = self._logout(self._mail)
+            return [], 0
     
     def _get_email_body(self, msg) -> str:
-        """Extract plain text body from email message."""
-        body = ""
-        
-        if msg.is_multipart():
-            for part in msg.walk():
-                content_type = part.get_content_type()
-                if content_type == "text/plain":
-                    try:
-                        body = part.get_payload(decode=True).decode("utf-8", errors="ignore")
-                        break
-                    except:
-                        pass
-        else:
-            try:
-                body = msg.get_payload(decode=True).decode("utf-8", errors="ignore")
-            except:
-                pass
+        """Extract the text body from an email message (plain preferred over HTML).
         
-        return body
+        HTML bodies are cut at the quoted history and reduced to text, since
+        the >-quote stripping in _analyze_response only covers plain text.
+        """
+        part = msg.get_body(preferencelist=("plain", "html"))
+        if part is None:
+            return ""
+        try:
+            content = part.get_content()
+        except (LookupError, ValueError) as e:
+            logger.debug(f"Could not decode email body: {e}")
+            return ""
+        if part.get_content_subtype() == "html":
+            content = _HTML_QUOTE_RE.split(content, maxsplit=1)[0]
+            content = html.unescape(_HTML_TAG_RE.sub(" ", content))
+        return content
     
-    def _is_proposal_reply(self, subject: str, body: str, from_addr: str = None) -> bool:
-        """Check if email is a reply to our proposal (not our original sent email)."""
-        subject_lower = subject.lower() if subject else ""
-        body_lower = body.lower() if body else ""
-        
+    def _is_reply_header(self, subject_lower: str, from_lower: str = "") -> bool:
+        """Check from the (lowercased) headers alone whether an email can be a reply to us."""
         # IMPORTANT: Skip emails that are our original sent emails
         # (they won't have "Re:" in subject and will be FROM our email address)
-        if from_addr:
-            from_lower = from_addr.lower()
+        if from_lower:
             # If email is FROM us and doesn't have "Re:" in subject, it's our original sent email
             if self.email_address and self.email_address.lower() in from_lower:
                 if not subject_lower.startswith("re:"):
                     return False
         
         # Must be a reply (has "Re:" in subject) to be considered
-        if not subject_lower.startswith("re:"):
+        return subject_lower.startswith("re:")
+    
+    def _find_lead_mention(self, subject_lower: str, body_lower: str) -> Optional[tuple]:
+        """Find the pending lead a message mentions as (reference_code, matched_by_code)."""
+        combined = subject_lower + " " + body_lower
+        
+        # Scan once for every code and business name; a reference code
+        # match wins, otherwise fall back to the first business name seen
+        pattern, terms = self._get_match_index()
+        if pattern is None:
+            return None
+        name_match = None
+        for match in pattern.finditer(combined):
+            is_code, code = terms[match.group()]
+            if is_code:
+                return (code, True)
+            if name_match is None:
+                name_match = (code, False)
+        return name_match
+    
+    def _is_proposal_reply(self, subject_lower: str, body_lower: str, from_lower: str = "",
+                           mention: Optional[tuple] = None) -> bool:
+        """Check if email is a reply to our proposal (not our original sent email).
+        
+        Takes lowercased subject, body and sender; ``mention`` is the result
+        of _find_lead_mention for this message.
+        """
+        if not self._is_reply_header(subject_lower, from_lower):
             return False
         
         # Check for proposal-related content
         is_reply = (
             "lead proposal" in subject_lower or
             "website" in body_lower or
-            any(code.lower() in body_lower for code in self._pending_leads.keys())
+            (mention is not None and mention[1])
         )
         
         return is_reply
     
-    def _match_reply_to_lead(self, subject: str, body: str) -> Optional[tuple]:
-        """Match a reply to a pending lead."""
-        subject_lower = subject.lower() if subject else ""
-        body_lower = body.lower() if body else ""
-        combined = subject_lower + " " + body_lower
-        
-        # First, try to match by reference code
-        for code, lead_info in self._pending_leads.items():
-            if code.lower() in combined:
-                return (code, lead_info)
-        
-        # Then, try to match by business name
-        for code, lead_info in self._pending_leads.items():
-            business_name = lead_info.get("business_name", "").lower()
-            if business_name and business_name in combined:
-                return (code, lead_info)
+    def _match_reply_to_lead(self, subject_lower: str, mention: Optional[tuple]) -> Optional[tuple]:
+        """Match a reply to a pending lead, given its _find_lead_mention result."""
+        # A reference code or business name found in the message wins
+        if mention is not None:
+            code = mention[0]
+            return (code, self._pending_leads[code])
         
         # Finally, if we only have one pending lead and it's a reply, assume it's for that lead
         if len(self._pending_leads) == 1 and "re:" in subject_lower:
@@ -262,60 +562,47 @@ class EmailReplyTracker:
         
         return None
     
-    def _analyze_response(self, body: str) -> str:
-        """Analyze email body to determine response type."""
-        body_lower = body.lower() if body else ""
+    def _analyze_response(self, body_lower: str) -> str:
+        """Analyze a lowercased email body to determine response type."""
+        body_lower = _QUOTE_RE.split(body_lower, maxsplit=1)[0][:ANALYZE_MAX_CHARS]
         
-        # Count positive and negative indicators
-        positive_count = sum(1 for kw in POSITIVE_KEYWORDS if kw in body_lower)
-        negative_count = sum(1 for kw in NEGATIVE_KEYWORDS if kw in body_lower)
+        # Signed score over all indicators in a single pass: > 0 = positive
+        score = sum(_KEYWORD_WEIGHT[kw] for kw in _KEYWORD_RE.findall(body_lower))
         
-        # Simple heuristic: more positive than negative = positive
-        if positive_count > negative_count:
+        if score > 0:
             return "positive"
-        elif negative_count > positive_count:
+        if score < 0:
             return "negative"
-        else:
-            # Check for very clear indicators
-            if any(word in body_lower.split() for word in ["yes", "interested", "confirm"]):
-                return "positive"
-            elif any(word in body_lower.split() for word in ["no", "unsubscribe"]):
-                return "negative"
-        
         return "unclear"
     
-    async def _handle_confirmation(self, reference_code: str, lead_info: dict, from_addr: str, body: str):
+    async def _handle_confirmation(self, reference_code: str, lead_info: PendingLead, from_addr: str, body: str):
         """Handle a confirmed lead."""
-        lead_info["status"] = "confirmed"
-        lead_info["confirmed_at"] = datetime.now().isoformat()
-        lead_info["confirmed_by"] = from_addr
-        lead_info["response_body"] = body[:500]  # Store first 500 chars of response
+        lead_info.status = "confirmed"
+        lead_info.confirmed_at = datetime.now().isoformat()
+        lead_info.confirmed_by = from_addr
+        lead_info.response_body = body[:500]  # Store first 500 chars of response
         
         if self.on_confirmation:
             try:
-                await self.on_confirmation(lead_info)
+                await self.on_confirmation(asdict(lead_info))
             except Exception as e:
                 logger.error(f"Error in confirmation callback: {e}")
         
-        # Remove from pending leads
-        if reference_code in self._pending_leads:
-            del self._pending_leads[reference_code]
+        self._remove_pending_lead(reference_code)
     
-    async def _handle_rejection(self, reference_code: str, lead_info: dict, from_addr: str, body: str):
+    async def _handle_rejection(self, reference_code: str, lead_info: PendingLead, from_addr: str, body: str):
         """Handle a rejected lead."""
-        lead_info["status"] = "rejected"
-        lead_info["rejected_at"] = datetime.now().isoformat()
-        lead_info["rejected_by"] = from_addr
+        lead_info.status = "rejected"
+        lead_info.rejected_at = datetime.now().isoformat()
+        lead_info.rejected_by = from_addr
         
         if self.on_rejection:
             try:
-                await self.on_rejection(lead_info)
+                await self.on_rejection(asdict(lead_info))
             except Exception as e:
                 logger.error(f"Error in rejection callback: {e}")
         
-        # Remove from pending leads
-        if reference_code in self._pending_leads:
-            del self._pending_leads[reference_code]
+        self._remove_pending_lead(reference_code)
     
     async def _process_email_response(self, msg_data: List) -> None:
         """Process email response data."""
@@ -323,21 +610,38 @@ class EmailReplyTracker:
             if not isinstance(response_part, tuple):
                 continue
             
-            msg = email.message_from_bytes(response_part[1])
+            # Parse headers only; most inbox mail is not a reply and needs no MIME parse
+            headers = BytesHeaderParser().parsebytes(response_part[1], headersonly=True)
             
             # Get email details
-            subject = self._decode_header(msg["Subject"])
-            from_addr = self._decode_header(msg["From"])
+            # str() because raw 8-bit headers come back as unhashable Header objects
+            subject = _decode_header(str(headers["Subject"] or ""))
+            from_addr = _decode_header(str(headers["From"] or ""))
+            # Lowercase once; every check below works on these copies
+            subject_lower = subject.lower()
+            from_lower = from_addr.lower()
+            if not self._is_reply_header(subject_lower, from_lower):
+                continue
+            
+            # A reference code in the subject identifies the lead without scanning the body
+            mention = self._find_lead_mention(subject_lower, "")
+            
+            msg = email.message_from_bytes(response_part[1], policy=policy.default)
             body = self._get_email_body(msg)
+            body_lower = body[:BODY_SCAN_MAX_CHARS].lower()
+            
+            # Otherwise one scan for reference codes and business names, shared by both checks below
+            if mention is None or not mention[1]:
+                mention = self._find_lead_mention(subject_lower, body_lower)
             
-            # Check if this is a reply to our proposal (pass from_addr to filter out our sent emails)
-            if not self._is_proposal_reply(subject, body, from_addr):
+            # Check if this is a reply to our proposal (pass from_lower to filter out our sent emails)
+            if not self._is_proposal_reply(subject_lower, body_lower, from_lower, mention):
                 continue
             
             logger.info(f"Found reply email: '{subject}' from {from_addr}")
             
             # Find matching pending lead
-            matched_lead = self._match_reply_to_lead(subject, body)
+            matched_lead = self._match_reply_to_lead(subject_lower, mention)
             
             if not matched_lead:
                 continue
@@ -345,16 +649,16 @@ class EmailReplyTracker:
             reference_code, lead_info = matched_lead
             
             # Determine response type
-            response_type = self._analyze_response(body)
+            response_type = self._analyze_response(body_lower)
             
             if response_type == "positive":
-                logger.info(f"✅ Positive response detected for {lead_info['business_name']}")
+                logger.info(f"✅ Positive response detected for {lead_info.business_name}")
                 await self._handle_confirmation(reference_code, lead_info, from_addr, body)
             elif response_type == "negative":
-                logger.info(f"❌ Negative response detected for {lead_info['business_name']}")
+                logger.info(f"❌ Negative response detected for {lead_info.business_name}")
                 await self._handle_rejection(reference_code, lead_info, from_addr, body)
             else:
-                logger.info(f"⚠️ Unclear response for {lead_info['business_name']}")
+                logger.info(f"⚠️ Unclear response for {lead_info.business_name}")
     
     def force_check(self):
         """Force an immediate check for replies (useful for testing)."""
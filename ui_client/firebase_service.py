@@ -11,6 +11,8 @@ Database structure:
   /leads/{lead_id}/
       { ...lead fields, status_history/... }
   /user_leads/{user_id}/{lead_id}: { status, business_name, ... }  (index)
+      Carries every field the lead list views render (INDEX_FIELDS), so
+      listing a user's leads is a single read; /leads/ is read for details.
 
 IMPORTANT: Firebase RTDB rules must allow read/write.
   Go to Firebase Console → Realtime Database → Rules, and set:
@@ -20,9 +22,18 @@ IMPORTANT: Firebase RTDB rules must allow read/write.
       ".write": true
     }
   }
+  Filtering a user's leads by status runs server-side when the index is
+  declared (otherwise it falls back to filtering locally):
+      "user_leads": { "$uid": { ".indexOn": ["status"] } }
 """
 
 import os
+import json
+import time
+import random
+import asyncio
+import heapq
+import functools
 import logging
 from datetime import datetime
 from typing import Dict, Any, List, Optional
@@ -30,6 +41,16 @@ from enum import Enum
 
 import httpx
 
+# orjson encodes request bodies much faster than httpx's stdlib json (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# HTTP/2 lets concurrent RTDB requests share one connection (needs h2)
+from .http2_support import HTTP2_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 # ── Firebase Configuration ─────────────────────────────────────────────
@@ -40,11 +61,53 @@ FIREBASE_DATABASE_URL = os.environ.get(
 
 FIREBASE_API_KEY = os.environ.get("FIREBASE_API_KEY", "")
 
+# Max concurrent RTDB GETs when fanning out over many leads
+READ_CONCURRENCY = 32
+
+# Lead fields denormalized into /user_leads for the dashboard/history lists
+INDEX_FIELDS = (
+    "lead_id", "status", "current_status", "business_name", "business_city",
+    "business_address", "business_phone", "business_email", "business_category",
+    "business_types", "business_rating", "research_priority", "research_summary",
+    "email_sent", "meeting_date", "meeting_time", "created_at", "updated_at",
+)
+
+# Leads whose created_at this process already knows (oldest evicted first)
+CREATED_AT_CACHE_MAX_ENTRIES = 10000
+
+# Seconds to cache per-user reads (profile, user_leads index); 0 disables
+READ_CACHE_TTL_SECONDS = float(os.environ.get("FIREBASE_READ_CACHE_TTL", "5"))
+READ_CACHE_MAX_ENTRIES = 1024
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_json(data: Any) -> bytes:
+    """Serialize a request body, with orjson when it is installed.
+    
+    Unknown types go through _json_default, so containers are encoded
+    in one pass without being copied first.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_json(content: bytes) -> Any:
+    """Parse a response body straight from bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
+_RTDB_PREFIX = f"{FIREBASE_DATABASE_URL}/"
+
+
+@functools.lru_cache(maxsize=4096)
 def _rtdb_url(path: str) -> str:
-    """Build full RTDB REST endpoint URL."""
-    path = path.strip("/")
-    return f"{FIREBASE_DATABASE_URL}/{path}.json"
+    """Build full RTDB REST endpoint URL (cached: the same user/lead paths recur)."""
+    return _RTDB_PREFIX + path.strip("/") + ".json"
 
 
 class LeadStatus(str, Enum):
@@ -73,7 +136,14 @@ class FirebaseLeadService:
         if self._initialized:
             return
         self._client: Optional[httpx.AsyncClient] = None
+        self._warmup_task: Optional[asyncio.Task] = None
         self._available = False
+        # safe lead key -> created_at, so repeat status writes skip the read
+        self._created_at_cache: Dict[str, str] = {}
+        # path -> (expires_at, value) for per-user reads
+        self._read_cache: Dict[str, tuple] = {}
+        # Cleared after the first 400 when the .indexOn ["status"] rule is missing
+        self._status_index_available = True
         self._initialized = True
         self._sync_init()
 
@@ -82,44 +152,104 @@ class FirebaseLeadService:
             logger.warning("⚠️ FIREBASE_DATABASE_URL not set – persistence disabled")
             return
         try:
-            self._client = httpx.AsyncClient(timeout=15.0)
+            # Every request goes to the one RTDB host: keep connections warm
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0,
+                ),
+                timeout=httpx.Timeout(15.0, connect=5.0),
+            )
             self._available = True
-            logger.info(f"🔗 Firebase REST client ready → {FIREBASE_DATABASE_URL}")
+            logger.info(
+                f"🔗 Firebase REST client ready → {FIREBASE_DATABASE_URL}"
+                f" ({'HTTP/2' if HTTP2_AVAILABLE else 'HTTP/1.1'})"
+            )
         except Exception as e:
             logger.error(f"❌ Failed to create httpx client: {e}")
+            return
+
+        # Created inside the app's event loop (lifespan/request): open the
+        # connection now so the first real write skips DNS + TCP + TLS
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._warmup_task = loop.create_task(self._warmup())
+
+    async def _warmup(self):
+        """Establish the pooled connection with a tiny shallow read of the root."""
+        try:
+            await self._client.get(_rtdb_url("/"), params={"shallow": "true"})
+            logger.debug("Firebase connection warmed up")
+        except Exception as e:
+            logger.debug(f"Firebase warmup failed (will connect on first use): {e}")
 
     # ── Low-level REST helpers ─────────────────────────────────────────
 
-    async def _get(self, path: str) -> Any:
+    async def _get(self, path: str, params: Optional[Dict[str, str]] = None) -> Any:
         url = _rtdb_url(path)
-        resp = await self._client.get(url)
+        resp = await self._client.get(url, params=params)
         resp.raise_for_status()
-        return resp.json()
+        return _decode_json(resp.content)
 
     async def _put(self, path: str, data: Any) -> Any:
         url = _rtdb_url(path)
-        resp = await self._client.put(url, json=_sanitize(data))
+        resp = await self._client.put(url, content=_encode_json(data), headers=_JSON_HEADERS)
         resp.raise_for_status()
-        return resp.json()
+        return _decode_json(resp.content)
 
     async def _patch(self, path: str, data: dict) -> Any:
         url = _rtdb_url(path)
-        resp = await self._client.patch(url, json=_sanitize(data))
+        resp = await self._client.patch(url, content=_encode_json(data), headers=_JSON_HEADERS)
         resp.raise_for_status()
-        return resp.json()
+        return _decode_json(resp.content)
 
-    async def _post(self, path: str, data: Any) -> str:
-        url = _rtdb_url(path)
-        resp = await self._client.post(url, json=_sanitize(data))
-        resp.raise_for_status()
-        result = resp.json()
-        return result.get("name", "") if isinstance(result, dict) else ""
+    async def _update_multi(self, updates: Dict[str, Any]) -> Any:
+        """Atomic multi-location update: one root PATCH keyed by full paths."""
+        return await self._patch("/", updates)
 
     async def _delete(self, path: str):
         url = _rtdb_url(path)
         resp = await self._client.delete(url)
         resp.raise_for_status()
 
+    async def _get_cached(self, path: str, params: Optional[Dict[str, str]] = None) -> Any:
+        """GET with a short TTL cache; callers must not mutate the result."""
+        key = path
+        if params:
+            key += "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        cached = self._read_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        value = await self._get(path, params)
+        if READ_CACHE_TTL_SECONDS > 0:
+            if len(self._read_cache) >= READ_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._read_cache.pop(next(iter(self._read_cache)))
+            self._read_cache[key] = (time.monotonic() + READ_CACHE_TTL_SECONDS, value)
+        return value
+
+    def _invalidate_user(self, safe_uid: str):
+        """Drop cached reads for a user after a write that touches them."""
+        self._read_cache.pop(f"/users/{safe_uid}/profile", None)
+        index_path = f"/user_leads/{safe_uid}"
+        for key in [key for key in self._read_cache
+                    if key == index_path or key.startswith(index_path + "?")]:
+            del self._read_cache[key]
+
+    async def _get_created_at(self, safe_lead: str, now_iso: str) -> str:
+        """created_at of a lead, read from RTDB only the first time it is seen."""
+        created_at = self._created_at_cache.get(safe_lead)
+        if created_at is None:
+            created_at = await self._get(f"/leads/{safe_lead}/created_at") or now_iso
+            if len(self._created_at_cache) >= CREATED_AT_CACHE_MAX_ENTRIES:
+                self._created_at_cache.pop(next(iter(self._created_at_cache)))
+            self._created_at_cache[safe_lead] = created_at
+        return created_at
+
     def is_available(self) -> bool:
         return self._available
 
@@ -144,7 +274,7 @@ class FirebaseLeadService:
             now_iso = datetime.utcnow().isoformat() + "Z"
             safe_uid = _safe_key(user_id)
 
-            existing = await self._get(f"/users/{safe_uid}/profile") or {}
+            existing = await self._get_cached(f"/users/{safe_uid}/profile") or {}
 
             profile = {
                 "user_id": user_id,
@@ -156,19 +286,22 @@ class FirebaseLeadService:
                 "created_at": existing.get("created_at") or now_iso,
             }
 
-            await self._put(f"/users/{safe_uid}/profile", profile)
-
-            await self._post(f"/users/{safe_uid}/login_history", {
-                "timestamp": now_iso,
-                "ip": ip_address,
-                "user_agent": (user_agent or "")[:200],
+            # Profile and the login_history append in one atomic write
+            await self._update_multi({
+                f"/users/{safe_uid}/profile": profile,
+                f"/users/{safe_uid}/login_history/{_generate_push_id()}": {
+                    "timestamp": now_iso,
+                    "ip": ip_address,
+                    "user_agent": (user_agent or "")[:200],
+                },
             })
+            self._invalidate_user(safe_uid)
 
-            logger.info(f"✅ User sign-in tracked: {user_id} ({email})")
+            logger.info("✅ User sign-in tracked: %s (%s)", user_id, email)
             return {"success": True, "user_id": user_id}
 
         except Exception as e:
-            logger.error(f"❌ Failed to track user sign-in: {e}")
+            logger.error("❌ Failed to track user sign-in: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"success": False, "error": str(e)}
 
     async def get_user_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
@@ -176,7 +309,8 @@ class FirebaseLeadService:
             return None
         try:
             safe_uid = _safe_key(user_id)
-            return await self._get(f"/users/{safe_uid}/profile")
+            profile = await self._get_cached(f"/users/{safe_uid}/profile")
+            return dict(profile) if isinstance(profile, dict) else profile
         except Exception as e:
             logger.error(f"Failed to get user profile: {e}")
             return None
@@ -207,28 +341,25 @@ class FirebaseLeadService:
             now_iso = datetime.utcnow().isoformat() + "Z"
             safe_lead = _safe_key(str(lead_id).strip())
 
-            logger.info(f"📝 Firebase write: lead={lead_id}, status={status.value}")
+            logger.info("📝 Firebase write: lead=%s, status=%s", lead_id, status.value)
 
-            existing_created = await self._get(f"/leads/{safe_lead}/created_at")
+            created_at = await self._get_created_at(safe_lead, now_iso)
 
+            user_id = user_info.get("user_id")
             lead_data: Dict[str, Any] = {
                 "lead_id": str(lead_id).strip(),
                 "current_status": status.value,
                 "status": status.value,
                 "business_name": str(lead_details.get("name", "Unknown")).strip() or "Unknown",
                 "updated_at": now_iso,
-                "created_at": existing_created or now_iso,
-                "user_id": str(user_info.get("user_id", "anonymous")).strip() if user_info.get("user_id") else "anonymous",
-                "user_email": user_info.get("email"),
-                "user_name": user_info.get("name"),
-                "business_phone": lead_details.get("phone"),
-                "business_email": lead_details.get("email"),
-                "business_address": lead_details.get("address"),
-                "business_city": lead_details.get("city"),
-                "business_category": lead_details.get("category"),
-                "business_types": lead_details.get("types", []),
+                "created_at": created_at,
+                "user_id": str(user_id).strip() if user_id else "anonymous",
                 "status_changed_at": now_iso,
             }
+            # Optional fields are only added when present, so no None-stripping pass
+            _copy_present(lead_data, user_info, _USER_FIELDS)
+            _copy_present(lead_data, lead_details, _BUSINESS_FIELDS)
+            lead_data["business_types"] = lead_details.get("types") or []
 
             rating = lead_details.get("rating")
             if rating is not None:
@@ -241,54 +372,43 @@ class FirebaseLeadService:
                 overview = research_data.get("overview")
                 if overview:
                     lead_data["research_summary"] = str(overview)[:5000]
-                lead_data["research_industry"] = research_data.get("industry")
+                _copy_present(lead_data, research_data, _RESEARCH_FIELDS)
                 rec = research_data.get("recommendation")
-                if isinstance(rec, dict):
-                    lead_data["research_priority"] = rec.get("priority")
+                if isinstance(rec, dict) and rec.get("priority") is not None:
+                    lead_data["research_priority"] = rec["priority"]
 
             if email_details:
                 lead_data["email_sent"] = True
                 sent_at = email_details.get("sent_at")
                 lead_data["email_sent_at"] = str(sent_at) if sent_at else now_iso
-                lead_data["email_subject"] = email_details.get("subject")
+                _copy_present(lead_data, email_details, _EMAIL_FIELDS)
 
             if status == LeadStatus.MEETING_SCHEDULED and meeting_details:
                 if meeting_details.get("date"):
                     lead_data["meeting_date"] = str(meeting_details["date"])
                 if meeting_details.get("time"):
                     lead_data["meeting_time"] = str(meeting_details["time"])
-                lead_data["meeting_calendar_link"] = meeting_details.get("calendar_link")
-                lead_data["meeting_meet_link"] = meeting_details.get("meet_link")
-                lead_data["meeting_title"] = meeting_details.get("title")
-
-            # Strip None values
-            lead_data_clean = {k: v for k, v in lead_data.items() if v is not None}
+                _copy_present(lead_data, meeting_details, _MEETING_FIELDS)
 
-            # Write lead
-            await self._patch(f"/leads/{safe_lead}", lead_data_clean)
-
-            # User→lead index
-            uid = lead_data_clean.get("user_id", "anonymous")
+            uid = lead_data["user_id"]
             safe_uid = _safe_key(uid)
-            await self._put(f"/user_leads/{safe_uid}/{safe_lead}", {
-                "status": status.value,
-                "business_name": lead_data_clean.get("business_name"),
-                "business_city": lead_data_clean.get("business_city"),
-                "updated_at": now_iso,
-            })
 
-            # Status history
-            await self._post(f"/leads/{safe_lead}/status_history", {
+            # Lead fields, user→lead index and status history in one atomic write
+            updates = _prefixed(f"/leads/{safe_lead}", lead_data)
+            updates.update(_prefixed(f"/user_leads/{safe_uid}/{safe_lead}", _index_entry(lead_data)))
+            updates[f"/leads/{safe_lead}/status_history/{_generate_push_id()}"] = {
                 "status": status.value,
                 "timestamp": now_iso,
                 "previous_status": previous_status,
-            })
+            }
+            await self._update_multi(updates)
+            self._invalidate_user(safe_uid)
 
-            logger.info(f"✅ Firebase write OK → lead {lead_id} ({status.value})")
+            logger.info("✅ Firebase write OK → lead %s (%s)", lead_id, status.value)
             return {"success": True, "lead_id": lead_id, "status": status.value}
 
         except Exception as e:
-            logger.error(f"❌ Firebase persist error for {lead_id}: {e}", exc_info=True)
+            logger.error("❌ Firebase persist error for %s: %s", lead_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"success": False, "error": str(e)}
 
     # ====================================================================
@@ -298,28 +418,71 @@ class FirebaseLeadService:
     async def get_leads_by_user(
         self, user_id: str, status: Optional[LeadStatus] = None
     ) -> List[Dict[str, Any]]:
-        """Get all leads for a user."""
+        """Get all leads for a user (list fields only, served from the user_leads index)."""
         if not self._available:
             return []
 
         try:
             safe_uid = _safe_key(user_id)
-            index = await self._get(f"/user_leads/{safe_uid}")
+            index_path = f"/user_leads/{safe_uid}"
+            if status and self._status_index_available:
+                # Let RTDB filter by status (values in REST queries are JSON-quoted)
+                try:
+                    index = await self._get_cached(index_path, {
+                        "orderBy": '"status"',
+                        "equalTo": f'"{status.value}"',
+                    })
+                except httpx.HTTPStatusError as e:
+                    # 400 "Index not defined" without the .indexOn rule; the
+                    # rules won't change under us, so stop asking this process
+                    if e.response.status_code != 400:
+                        raise
+                    logger.info(f"Server-side status filter unavailable, filtering locally: {e}")
+                    self._status_index_available = False
+                    index = await self._get_cached(index_path)
+            else:
+                index = await self._get_cached(index_path)
 
             if not index or not isinstance(index, dict):
                 return []
 
             leads = []
-            for lead_key in index.keys():
-                lead_data = await self._get(f"/leads/{lead_key}")
+            legacy_keys = []
+            for lead_key, entry in index.items():
+                if not isinstance(entry, dict):
+                    continue
+                # Entries written before the index was denormalized lack lead_id
+                if "lead_id" not in entry:
+                    legacy_keys.append(lead_key)
+                    continue
+                if status and entry.get("status") != status.value:
+                    continue
+                leads.append(dict(entry))  # cached index entries stay untouched
+
+            semaphore = asyncio.Semaphore(READ_CONCURRENCY)
+
+            async def fetch_lead(lead_key: str) -> Any:
+                async with semaphore:
+                    return await self._get(f"/leads/{lead_key}")
+
+            # Fetch legacy leads concurrently; one failed GET drops only that lead
+            results = await asyncio.gather(
+                *(fetch_lead(lead_key) for lead_key in legacy_keys),
+                return_exceptions=True,
+            )
+
+            for lead_data in results:
+                if isinstance(lead_data, Exception):
+                    logger.warning(f"Failed to fetch lead for {user_id}: {lead_data}")
+                    continue
                 if lead_data and isinstance(lead_data, dict):
                     lead_data.pop("status_history", None)
                     if status and lead_data.get("status") != status.value:
                         continue
                     leads.append(lead_data)
 
-            leads.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
-            return leads[:100]
+            # Most recently updated first; only the top 100 need ordering
+            return heapq.nlargest(100, leads, key=lambda x: x.get("updated_at", ""))
 
         except Exception as e:
             logger.error(f"Failed to query leads for {user_id}: {e}")
@@ -344,7 +507,13 @@ class FirebaseLeadService:
             return {"total": 0, "by_status": {}, "cities": []}
 
         try:
-            leads = await self.get_leads_by_user(user_id)
+            # Every index entry carries status and city: no per-lead reads needed
+            safe_uid = _safe_key(user_id)
+            index = await self._get_cached(f"/user_leads/{safe_uid}")
+            leads = [
+                entry for entry in (index.values() if isinstance(index, dict) else ())
+                if isinstance(entry, dict)
+            ]
             by_status: Dict[str, int] = {}
             cities_set: set = set()
 
@@ -370,28 +539,90 @@ class FirebaseLeadService:
 
 
 # ── Helpers ──
+# (source key, lead field) pairs copied verbatim into lead_data when not None
+_USER_FIELDS = (("email", "user_email"), ("name", "user_name"))
+_BUSINESS_FIELDS = (
+    ("phone", "business_phone"), ("email", "business_email"),
+    ("address", "business_address"), ("city", "business_city"),
+    ("category", "business_category"),
+)
+_RESEARCH_FIELDS = (("industry", "research_industry"),)
+_EMAIL_FIELDS = (("subject", "email_subject"),)
+_MEETING_FIELDS = (
+    ("calendar_link", "meeting_calendar_link"), ("meet_link", "meeting_meet_link"),
+    ("title", "meeting_title"),
+)
+
+
+def _copy_present(dest: Dict[str, Any], src: Dict[str, Any], fields) -> None:
+    """Copy each mapped field from src into dest, skipping missing/None values."""
+    for src_key, dest_key in fields:
+        value = src.get(src_key)
+        if value is not None:
+            dest[dest_key] = value
+
+
+def _prefixed(prefix: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a PATCH body into multi-location update entries under prefix."""
+    return {f"{prefix}/{k}": v for k, v in data.items()}
+
+
+# Firebase push-ID alphabet (ASCII-ordered so IDs sort chronologically)
+_PUSH_CHARS = "-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz"
+_last_push_ms = 0
+_last_push_rand: List[int] = []
+
+
+def _generate_push_id() -> str:
+    """Generate a Firebase-style push ID client-side.
+    
+    8 chars of millisecond timestamp + 12 random chars, using the same
+    scheme as the Firebase SDKs: IDs created in the same millisecond
+    increment the random part so they stay unique and ordered.
+    """
+    global _last_push_ms, _last_push_rand
+    now_ms = int(time.time() * 1000)
+    if now_ms == _last_push_ms:
+        # Increment the random part as a base-64 number
+        i = 11
+        while i >= 0 and _last_push_rand[i] == 63:
+            _last_push_rand[i] = 0
+            i -= 1
+        if i >= 0:
+            _last_push_rand[i] += 1
+    else:
+        _last_push_ms = now_ms
+        _last_push_rand = [random.randrange(64) for _ in range(12)]
+
+    time_chars = []
+    for _ in range(8):
+        time_chars.append(_PUSH_CHARS[now_ms % 64])
+        now_ms //= 64
+    return "".join(reversed(time_chars)) + "".join(_PUSH_CHARS[n] for n in _last_push_rand)
+
+
+_SAFE_KEY_TABLE = str.maketrans({ch: "_" for ch in ".#$[]/"})
+
+
 def _safe_key(value: str) -> str:
     """Firebase RTDB keys cannot contain . $ # [ ] /"""
     if not value:
         return "unknown"
-    for ch in ".#$[]/":
-        value = value.replace(ch, "_")
-    return value
-
-
-def _sanitize(obj: Any) -> Any:
-    """Recursively convert datetime/Enum objects so httpx JSON serializer can handle them."""
-    if obj is None:
-        return obj
-    if isinstance(obj, dict):
-        return {k: _sanitize(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [_sanitize(i) for i in obj]
-    if hasattr(obj, "isoformat"):
-        return obj.isoformat()
+    return value.translate(_SAFE_KEY_TABLE)
+
+
+def _index_entry(lead_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Project lead fields onto the denormalized /user_leads entry."""
+    return {k: lead_data[k] for k in INDEX_FIELDS if lead_data.get(k) is not None}
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode datetime-like and Enum values the JSON encoders don't handle natively."""
     if isinstance(obj, Enum):
         return obj.value
-    return obj
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 # ── Singleton + drop-in helpers ────────────────────────────────────────
@@ -419,7 +650,7 @@ async def persist_sdr_engaged(
 ) -> Dict[str, Any]:
     if not lead_id:
         return {"success": False, "error": "No lead_id", "skipped": True}
-    logger.info(f"🔔 PERSIST: SDR_ENGAGED for lead {lead_id}")
+    logger.info("🔔 PERSIST: SDR_ENGAGED for lead %s", lead_id)
     svc = get_firebase_service()
     if not svc.is_available():
         return {"success": False, "error": "Firebase not available", "skipped": True}
@@ -439,7 +670,7 @@ async def persist_lead_converting(
 ) -> Dict[str, Any]:
     if not lead_id:
         return {"success": False, "error": "No lead_id", "skipped": True}
-    logger.info(f"🔔 PERSIST: CONVERTING for lead {lead_id}")
+    logger.info("🔔 PERSIST: CONVERTING for lead %s", lead_id)
     svc = get_firebase_service()
     if not svc.is_available():
         return {"success": False, "error": "Firebase not available", "skipped": True}
@@ -459,7 +690,7 @@ async def persist_meeting_scheduled(
 ) -> Dict[str, Any]:
     if not lead_id:
         return {"success": False, "error": "No lead_id", "skipped": True}
-    logger.info(f"🔔 PERSIST: MEETING_SCHEDULED for lead {lead_id}")
+    logger.info("🔔 PERSIST: MEETING_SCHEDULED for lead %s", lead_id)
     svc = get_firebase_service()
     if not svc.is_available():
         return {"success": False, "error": "Firebase not available", "skipped": True}
@@ -478,7 +709,7 @@ async def persist_lead_confirmed(
     """Mark a lead as fully confirmed (final status)."""
     if not lead_id:
         return {"success": False, "error": "No lead_id", "skipped": True}
-    logger.info(f"🔔 PERSIST: CONFIRMED for lead {lead_id}")
+    logger.info("🔔 PERSIST: CONFIRMED for lead %s", lead_id)
     svc = get_firebase_service()
     if not svc.is_available():
         return {"success": False, "error": "Firebase not available", "skipped": True}
@@ -506,29 +737,26 @@ async def persist_lead_confirmed(
         if note:
             update_data["confirmation_note"] = note
         
-        await svc._patch(f"/leads/{safe_lead}", update_data)
-        
-        # Update user→lead index
         uid = existing_lead.get("user_id", "anonymous")
         safe_uid = _safe_key(uid)
-        await svc._patch(f"/user_leads/{safe_uid}/{safe_lead}", {
-            "status": LeadStatus.CONFIRMED.value,
-            "updated_at": now_iso,
-        })
         
-        # Add to status history
-        await svc._post(f"/leads/{safe_lead}/status_history", {
+        # Update lead, user→lead index and status history in one atomic write
+        updates = _prefixed(f"/leads/{safe_lead}", update_data)
+        updates.update(_prefixed(f"/user_leads/{safe_uid}/{safe_lead}", _index_entry(update_data)))
+        updates[f"/leads/{safe_lead}/status_history/{_generate_push_id()}"] = {
             "status": LeadStatus.CONFIRMED.value,
             "timestamp": now_iso,
             "previous_status": previous_status,
             "note": note,
-        })
+        }
+        await svc._update_multi(updates)
+        svc._invalidate_user(safe_uid)
         
-        logger.info(f"✅ Lead {lead_id} confirmed!")
+        logger.info("✅ Lead %s confirmed!", lead_id)
         return {"success": True, "lead_id": lead_id, "status": LeadStatus.CONFIRMED.value}
         
     except Exception as e:
-        logger.error(f"❌ Failed to confirm lead {lead_id}: {e}", exc_info=True)
+        logger.error("❌ Failed to confirm lead %s: %s", lead_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {"success": False, "error": str(e)}
 
 
@@ -543,7 +771,7 @@ async def add_note_to_lead(
     if not note:
         return {"success": False, "error": "No note provided"}
     
-    logger.info(f"🔔 ADD NOTE to lead {lead_id}")
+    logger.info("🔔 ADD NOTE to lead %s", lead_id)
     svc = get_firebase_service()
     if not svc.is_available():
         return {"success": False, "error": "Firebase not available", "skipped": True}
@@ -559,16 +787,17 @@ async def add_note_to_lead(
             "user_email": user_info.get("email") if user_info else None,
         }
         
-        await svc._post(f"/leads/{safe_lead}/notes", note_data)
-        
-        # Update the updated_at timestamp
-        await svc._patch(f"/leads/{safe_lead}", {"updated_at": now_iso})
+        # Append the note and bump updated_at in one atomic write
+        await svc._update_multi({
+            f"/leads/{safe_lead}/notes/{_generate_push_id()}": note_data,
+            f"/leads/{safe_lead}/updated_at": now_iso,
+        })
         
-        logger.info(f"✅ Note added to lead {lead_id}")
+        logger.info("✅ Note added to lead %s", lead_id)
         return {"success": True, "lead_id": lead_id}
         
     except Exception as e:
-        logger.error(f"❌ Failed to add note to lead {lead_id}: {e}", exc_info=True)
+        logger.error("❌ Failed to add note to lead %s: %s", lead_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {"success": False, "error": str(e)}
 
 
@@ -606,6 +835,26 @@ async def get_lead_full_details(lead_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# Dashboard column → Firebase status
+_STATUS_MAP = {
+    "sdr_engaged": LeadStatus.ENGAGED_SDR,
+    "engaged": LeadStatus.ENGAGED_SDR,
+    "sdr": LeadStatus.ENGAGED_SDR,
+    "converting": LeadStatus.CONVERTING,
+    "lead_manager": LeadStatus.CONVERTING,
+    "confirmed": LeadStatus.CONVERTING,
+    "meeting_scheduled": LeadStatus.MEETING_SCHEDULED,
+    "meeting": LeadStatus.MEETING_SCHEDULED,
+    "calendar": LeadStatus.MEETING_SCHEDULED,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_col(col: str) -> Optional[LeadStatus]:
+    """Map a dashboard column name to its status (cached: the same few names recur)."""
+    return _STATUS_MAP.get(col.lower().strip())
+
+
 async def update_lead_status_by_column(
     lead_id: str,
     column_status: str,
@@ -617,24 +866,10 @@ async def update_lead_status_by_column(
     if not lead_id:
         return {"success": False, "error": "No lead_id", "skipped": True}
     
-    # Map dashboard column status to Firebase status
-    status_map = {
-        "sdr_engaged": LeadStatus.ENGAGED_SDR,
-        "engaged": LeadStatus.ENGAGED_SDR,
-        "sdr": LeadStatus.ENGAGED_SDR,
-        "converting": LeadStatus.CONVERTING,
-        "lead_manager": LeadStatus.CONVERTING,
-        "confirmed": LeadStatus.CONVERTING,
-        "meeting_scheduled": LeadStatus.MEETING_SCHEDULED,
-        "meeting": LeadStatus.MEETING_SCHEDULED,
-        "calendar": LeadStatus.MEETING_SCHEDULED,
-    }
-    
-    column_lower = column_status.lower().strip()
-    firebase_status = status_map.get(column_lower)
+    firebase_status = _resolve_col(column_status)
     
     if not firebase_status:
-        logger.warning(f"Unknown column status: {column_status}, defaulting to CONVERTING")
+        logger.warning("Unknown column status: %s, defaulting to CONVERTING", column_status)
         firebase_status = LeadStatus.CONVERTING
     
     svc = get_firebase_service()
@@ -682,27 +917,24 @@ async def update_lead_status_by_column(
         # Remove None values
         update_data = {k: v for k, v in update_data.items() if v is not None}
         
-        await svc._patch(f"/leads/{safe_lead}", update_data)
-        
-        # Update user→lead index
         uid = update_data.get("user_id") or (existing.get("user_id") if existing else "anonymous") or "anonymous"
         safe_uid = _safe_key(uid)
-        await svc._patch(f"/user_leads/{safe_uid}/{safe_lead}", {
-            "status": firebase_status.value,
-            "updated_at": now_iso,
-        })
         
-        # Add to status history
-        await svc._post(f"/leads/{safe_lead}/status_history", {
+        # Update lead, user→lead index and status history in one atomic write
+        updates = _prefixed(f"/leads/{safe_lead}", update_data)
+        updates.update(_prefixed(f"/user_leads/{safe_uid}/{safe_lead}", _index_entry(update_data)))
+        updates[f"/leads/{safe_lead}/status_history/{_generate_push_id()}"] = {
             "status": firebase_status.value,
             "timestamp": now_iso,
             "previous_status": previous_status,
             "source": "column_update",
-        })
+        }
+        await svc._update_multi(updates)
+        svc._invalidate_user(safe_uid)
         
-        logger.info(f"✅ Lead {lead_id} status updated to {firebase_status.value} (from column: {column_status})")
+        logger.info("✅ Lead %s status updated to %s (from column: %s)", lead_id, firebase_status.value, column_status)
         return {"success": True, "lead_id": lead_id, "status": firebase_status.value}
         
     except Exception as e:
-        logger.error(f"❌ Failed to update lead status {lead_id}: {e}", exc_info=True)
+        logger.error("❌ Failed to update lead status %s: %s", lead_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {"success": False, "error": str(e)}
@@ -0,0 +1,13 @@
+"""
+HTTP/2 availability for the shared httpx clients.
+
+httpx only speaks HTTP/2 when the optional h2 package is installed, so
+main.py, firebase_service.py and direct_search.py all read this flag
+before passing http2= to their AsyncClient.
+"""
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
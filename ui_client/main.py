@@ -54,7 +54,7 @@ except ImportError:
 
 # Import direct Google Maps search for reliable lead finding (businesses without websites)
 try:
-    from .direct_search import direct_search_businesses
+    from .direct_search import direct_search_businesses, close_gemini_client
     DIRECT_SEARCH_AVAILABLE = True
     logger.info("Direct Google Maps search module loaded - finds businesses WITHOUT websites")
 except ImportError as e:
@@ -70,9 +70,14 @@ except ImportError as e:
     SDR_RESEARCH_AVAILABLE = False
     logger.warning(f"SDR Research module not available: {e}")
 
+# Confirmation codes in proposal emails; must match what the email tracker looks for
+from .reference_codes import generate_reference_code
+
 # Import email reply tracker for automatic lead confirmation
 try:
-    from .email_tracker import EmailReplyTracker, init_email_tracker, get_email_tracker
+    from .email_tracker import (
+        EmailReplyTracker, init_email_tracker, get_email_tracker
+    )
     EMAIL_TRACKER_AVAILABLE = True
     logger.info("Email Reply Tracker module loaded - monitors inbox for confirmations")
 except ImportError as e:
@@ -83,7 +88,7 @@ except ImportError as e:
 try:
     from .auth import (
         get_current_user, require_auth, get_auth_state, optional_auth,
-        AuthState, CLERK_PUBLISHABLE_KEY
+        AuthState, AuthMiddleware, CLERK_PUBLISHABLE_KEY
     )
     AUTH_AVAILABLE = True
     logger.info("Clerk Authentication module loaded")
@@ -121,6 +126,23 @@ except ImportError as e:
     CALENDAR_UTILS_AVAILABLE = False
     logger.warning(f"Calendar utilities not available: {e}")
 
+# orjson for fast WebSocket message serialization (optional - falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# HTTP/2 for the shared outbound client (optional - needs h2)
+from .http2_support import HTTP2_AVAILABLE
+
+# uvloop: libuv-backed event loop for the WebSocket/HTTP-heavy workload (optional)
+try:
+    import uvloop  # noqa: F401
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Ensure imports work
 try:
     import common.config
@@ -259,6 +281,21 @@ app_state = {
     "human_input_requests": {},  # dict[str, HumanInputRequest]
 }
 
+def _ws_default(obj: Any) -> Any:
+    """JSON fallback for WebSocket payloads: ISO datetimes and Enum values, as orjson emits them."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _dump_ws_message(data: dict[str, Any]) -> str:
+    """Serialize a WebSocket update (orjson when installed; same output shape either way)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=_ws_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=_ws_default)
+
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
     
@@ -279,22 +316,38 @@ class ConnectionManager:
         if not self.active_connections:
             return
         
-        message = json.dumps(data, default=str)
-        disconnected = set()
+        message = _dump_ws_message(data)
         
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"Error sending WebSocket message: {e}")
-                disconnected.add(connection)
+        # Send to every client concurrently so one slow socket doesn't hold up the rest
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True,
+        )
         
         # Remove disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending WebSocket message: {result}")
+                self.disconnect(connection)
 
 manager = ConnectionManager()
 
+# Shared outbound HTTP client (agents, callbacks, webhooks); created in lifespan
+http_client_instance: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the app-wide httpx client so calls reuse pooled keep-alive connections."""
+    global http_client_instance
+    if http_client_instance is None or http_client_instance.is_closed:
+        http_client_instance = httpx.AsyncClient(
+            timeout=httpx.Timeout(300.0, connect=10.0),
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            http2=HTTP2_AVAILABLE,
+        )
+    return http_client_instance
+
 # Email tracker instance
 email_tracker_instance = None
 
@@ -431,17 +484,20 @@ def setup_google_credentials():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handles application startup and shutdown events."""
-    global email_tracker_instance
+    global email_tracker_instance, http_client_instance
     
     logger.info("=" * 60)
     logger.info("🚀 LeadPilot UI Client starting up...")
     logger.info(f"   Environment: {'Railway' if os.environ.get('RAILWAY_ENVIRONMENT') else 'Local'}")
     logger.info(f"   Port: {os.environ.get('PORT', '8000')}")
+    logger.info(f"   Event loop: {type(asyncio.get_running_loop()).__module__}")
     logger.info("=" * 60)
     
     # Setup Google Cloud credentials (Railway support)
     setup_google_credentials()
     
+    app.state.http_client = get_http_client()
+    
     # Initialize Firebase service
     if BIGQUERY_AVAILABLE:
         try:
@@ -474,12 +530,21 @@ async def lifespan(app: FastAPI):
     # Cleanup
     if email_tracker_instance:
         await email_tracker_instance.stop()
+    if DIRECT_SEARCH_AVAILABLE:
+        await close_gemini_client()
+    if http_client_instance is not None:
+        await http_client_instance.aclose()
+        http_client_instance = None
     
     logger.info("👋 LeadPilot UI Client shutting down...")
 
 app = FastAPI(lifespan=lifespan)
 templates = Jinja2Templates(directory=str(templates_dir))
 
+# Resolve the Clerk user once per request for all auth dependencies
+if AUTH_AVAILABLE:
+    app.add_middleware(AuthMiddleware)
+
 # Mount static files with additional logging
 logger.info(f"Mounting static files from {static_dir} to /static")
 try:
@@ -527,91 +592,91 @@ async def call_lead_finder_agent_a2a(city: str, session_id: str) -> dict[str, An
     }
     
     try:
-        async with httpx.AsyncClient() as http_client:
-            a2a_client = A2AClient(httpx_client=http_client, url=lead_finder_url)
-            
-            # Prepare A2A message
-            a2a_task_id = f"lead-search-{session_id}"
-            
-            search_data = {
-                "city": city,
-            }
-            
-            sdk_message = A2AMessage(
-                taskId=a2a_task_id,
-                contextId=session_id,
-                messageId=str(uuid.uuid4()),
-                role=A2ARole.user,
-                parts=[A2ADataPart(data=search_data)],
-                metadata={"operation": "find_leads", "city": city},
-            )
-            
-            sdk_send_params = MessageSendParams(
-                message=sdk_message,
-                configuration=MessageSendConfiguration(
-                    acceptedOutputModes=["data", "application/json"]
-                ),
+        http_client = get_http_client()
+        a2a_client = A2AClient(httpx_client=http_client, url=lead_finder_url)
+        
+        # Prepare A2A message
+        a2a_task_id = f"lead-search-{session_id}"
+        
+        search_data = {
+            "city": city,
+        }
+        
+        sdk_message = A2AMessage(
+            taskId=a2a_task_id,
+            contextId=session_id,
+            messageId=str(uuid.uuid4()),
+            role=A2ARole.user,
+            parts=[A2ADataPart(data=search_data)],
+            metadata={"operation": "find_leads", "city": city},
+        )
+        
+        sdk_send_params = MessageSendParams(
+            message=sdk_message,
+            configuration=MessageSendConfiguration(
+                acceptedOutputModes=["data", "application/json"]
+            ),
+        )
+        
+        sdk_request = SendMessageRequest(
+            id=str(uuid.uuid4()), params=sdk_send_params
+        )
+        
+        # Send request to Lead Finder
+        response: SendMessageResponse = await a2a_client.send_message(sdk_request)
+        root_response_part = response.root
+        
+        if isinstance(root_response_part, JSONRPCErrorResponse):
+            actual_error = root_response_part.error
+            business_logger.error(
+                f"A2A Error from Lead Finder: {actual_error.code} - {actual_error.message}"
             )
+            outcome["error"] = f"A2A Error: {actual_error.code} - {actual_error.message}"
             
-            sdk_request = SendMessageRequest(
-                id=str(uuid.uuid4()), params=sdk_send_params
+        elif isinstance(root_response_part, SendMessageSuccessResponse):
+            task_result: A2ATask = root_response_part.result
+            business_logger.info(
+                f"Lead Finder task {task_result.id} completed with state: {task_result.status.state}"
             )
             
-            # Send request to Lead Finder
-            response: SendMessageResponse = await a2a_client.send_message(sdk_request)
-            root_response_part = response.root
-            
-            if isinstance(root_response_part, JSONRPCErrorResponse):
-                actual_error = root_response_part.error
-                business_logger.error(
-                    f"A2A Error from Lead Finder: {actual_error.code} - {actual_error.message}"
+            # Extract business data from artifacts
+            if task_result.artifacts:
+                lead_results_artifact = next(
+                    (
+                        a
+                        for a in task_result.artifacts
+                        if a.name == config.DEFAULT_LEAD_FINDER_ARTIFACT_NAME
+                    ),
+                    None,
                 )
-                outcome["error"] = f"A2A Error: {actual_error.code} - {actual_error.message}"
                 
-            elif isinstance(root_response_part, SendMessageSuccessResponse):
-                task_result: A2ATask = root_response_part.result
-                business_logger.info(
-                    f"Lead Finder task {task_result.id} completed with state: {task_result.status.state}"
-                )
-                
-                # Extract business data from artifacts
-                if task_result.artifacts:
-                    lead_results_artifact = next(
-                        (
-                            a
-                            for a in task_result.artifacts
-                            if a.name == config.DEFAULT_LEAD_FINDER_ARTIFACT_NAME
-                        ),
-                        None,
-                    )
-                    
-                    if lead_results_artifact and lead_results_artifact.parts:
-                        art_part_root = lead_results_artifact.parts[0].root
-                        if isinstance(art_part_root, A2ADataPart):
-                            result_data = art_part_root.data
-                            business_logger.info(f"Extracted Lead Results: {result_data}")
-                            
-                            if isinstance(result_data, dict) and "businesses" in result_data:
-                                outcome["success"] = True
-                                outcome["businesses"] = result_data["businesses"]
-                            else:
-                                business_logger.warning("Unexpected lead results format")
-                                outcome["error"] = "Invalid lead results format"
+                if lead_results_artifact and lead_results_artifact.parts:
+                    art_part_root = lead_results_artifact.parts[0].root
+                    if isinstance(art_part_root, A2ADataPart):
+                        result_data = art_part_root.data
+                        business_logger.info(f"Extracted Lead Results: {result_data}")
+                        
+                        if isinstance(result_data, dict) and "businesses" in result_data:
+                            outcome["success"] = True
+                            outcome["businesses"] = result_data["businesses"]
                         else:
-                            business_logger.warning(f"Unexpected artifact part type: {type(art_part_root)}")
+                            business_logger.warning("Unexpected lead results format")
+                            outcome["error"] = "Invalid lead results format"
                     else:
-                        business_logger.info("Lead results artifact not found or empty - checking for empty results")
-                        # Don't set this as an error immediately, let the success flow handle empty results
-                        outcome["success"] = True
-                        outcome["businesses"] = []
+                        business_logger.warning(f"Unexpected artifact part type: {type(art_part_root)}")
                 else:
-                    business_logger.info("No artifacts found in Lead Finder response - treating as empty results")
+                    business_logger.info("Lead results artifact not found or empty - checking for empty results")
+                    # Don't set this as an error immediately, let the success flow handle empty results
                     outcome["success"] = True
                     outcome["businesses"] = []
             else:
-                business_logger.error(f"Invalid A2A response type: {type(root_response_part)}")
-                outcome["error"] = "Invalid response type"
-                
+                business_logger.info("No artifacts found in Lead Finder response - treating as empty results")
+                outcome["success"] = True
+                outcome["businesses"] = []
+        else:
+            business_logger.error(f"Invalid A2A response type: {type(root_response_part)}")
+            outcome["error"] = "Invalid response type"
+            
     except Exception as e:
         if A2A_AVAILABLE and 'A2AClientHTTPError' in str(type(e)):
             business_logger.error(f"HTTP Error calling Lead Finder: {e}")
@@ -644,57 +709,57 @@ async def call_lead_finder_agent_simple(city: str, session_id: str) -> dict[str,
     }
     
     try:
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            # Try different endpoints that might exist
-            endpoints_to_try = [
-                f"{lead_finder_url}/find_leads",
-                f"{lead_finder_url}/search",
-                f"{lead_finder_url}/",
-            ]
-            
-            search_data = {
-                "city": city,
-                "max_results": 50,
-                "session_id": session_id,
-            }
-            
-            for endpoint in endpoints_to_try:
-                try:
-                    business_logger.info(f"Trying endpoint: {endpoint}")
-                    response = await client.post(endpoint, json=search_data)
+        client = get_http_client()
+        # Try different endpoints that might exist
+        endpoints_to_try = [
+            f"{lead_finder_url}/find_leads",
+            f"{lead_finder_url}/search",
+            f"{lead_finder_url}/",
+        ]
+        
+        search_data = {
+            "city": city,
+            "max_results": 50,
+            "session_id": session_id,
+        }
+        
+        for endpoint in endpoints_to_try:
+            try:
+                business_logger.info(f"Trying endpoint: {endpoint}")
+                response = await client.post(endpoint, json=search_data, timeout=300.0)
+                
+                if response.status_code == 200:
+                    result_data = response.json()
+                    business_logger.info(f"Got response from {endpoint}: {result_data}")
                     
-                    if response.status_code == 200:
-                        result_data = response.json()
-                        business_logger.info(f"Got response from {endpoint}: {result_data}")
-                        
-                        # Handle different response formats
-                        if isinstance(result_data, dict):
-                            if "businesses" in result_data:
-                                outcome["success"] = True
-                                outcome["businesses"] = result_data["businesses"]
-                                break
-                            elif "results" in result_data:
-                                outcome["success"] = True
-                                outcome["businesses"] = result_data["results"]
-                                break
-                            elif "data" in result_data:
-                                outcome["success"] = True
-                                outcome["businesses"] = result_data["data"]
-                                break
-                        elif isinstance(result_data, list):
+                    # Handle different response formats
+                    if isinstance(result_data, dict):
+                        if "businesses" in result_data:
                             outcome["success"] = True
-                            outcome["businesses"] = result_data
+                            outcome["businesses"] = result_data["businesses"]
                             break
-                    
-                    business_logger.warning(f"Endpoint {endpoint} returned status {response.status_code}")
-                    
-                except Exception as e:
-                    business_logger.warning(f"Endpoint {endpoint} failed: {e}")
-                    continue
-            
-            if not outcome["success"]:
-                outcome["error"] = "All Lead Finder endpoints failed or returned no data"
+                        elif "results" in result_data:
+                            outcome["success"] = True
+                            outcome["businesses"] = result_data["results"]
+                            break
+                        elif "data" in result_data:
+                            outcome["success"] = True
+                            outcome["businesses"] = result_data["data"]
+                            break
+                    elif isinstance(result_data, list):
+                        outcome["success"] = True
+                        outcome["businesses"] = result_data
+                        break
+                
+                business_logger.warning(f"Endpoint {endpoint} returned status {response.status_code}")
                 
+            except Exception as e:
+                business_logger.warning(f"Endpoint {endpoint} failed: {e}")
+                continue
+        
+        if not outcome["success"]:
+            outcome["error"] = "All Lead Finder endpoints failed or returned no data"
+            
     except Exception as e:
         business_logger.error(f"Unexpected error calling Lead Finder: {e}", exc_info=True)
         outcome["error"] = f"Unexpected error: {e}"
@@ -729,56 +794,56 @@ async def call_sdr_agent_a2a(business_data: dict[str, Any], session_id: str) ->
     }
     
     try:
-        async with httpx.AsyncClient() as http_client:
-            a2a_client = A2AClient(httpx_client=http_client, url=sdr_url)
-            
-            # Prepare A2A message
-            a2a_task_id = f"sdr-engagement-{session_id}-{business_data.get('id', 'unknown')}"
-            
-            sdk_message = A2AMessage(
-                taskId=a2a_task_id,
-                contextId=session_id,
-                messageId=str(uuid.uuid4()),
-                role=A2ARole.user,
-                parts=[A2ADataPart(data=business_data)],
-                metadata={"operation": "engage_lead", "business_id": business_data.get("id")},
+        http_client = get_http_client()
+        a2a_client = A2AClient(httpx_client=http_client, url=sdr_url)
+        
+        # Prepare A2A message
+        a2a_task_id = f"sdr-engagement-{session_id}-{business_data.get('id', 'unknown')}"
+        
+        sdk_message = A2AMessage(
+            taskId=a2a_task_id,
+            contextId=session_id,
+            messageId=str(uuid.uuid4()),
+            role=A2ARole.user,
+            parts=[A2ADataPart(data=business_data)],
+            metadata={"operation": "engage_lead", "business_id": business_data.get("id")},
+        )
+        
+        sdk_send_params = MessageSendParams(
+            message=sdk_message,
+            configuration=MessageSendConfiguration(
+                acceptedOutputModes=["data", "application/json"]
+            ),
+        )
+        
+        sdk_request = SendMessageRequest(
+            id=str(uuid.uuid4()), params=sdk_send_params
+        )
+        
+        # Send request to SDR agent
+        response: SendMessageResponse = await a2a_client.send_message(sdk_request)
+        root_response_part = response.root
+        
+        if isinstance(root_response_part, JSONRPCErrorResponse):
+            actual_error = root_response_part.error
+            business_logger.error(
+                f"A2A Error from SDR agent: {actual_error.code} - {actual_error.message}"
             )
+            outcome["error"] = f"A2A Error: {actual_error.code} - {actual_error.message}"
             
-            sdk_send_params = MessageSendParams(
-                message=sdk_message,
-                configuration=MessageSendConfiguration(
-                    acceptedOutputModes=["data", "application/json"]
-                ),
+        elif isinstance(root_response_part, SendMessageSuccessResponse):
+            task_result: A2ATask = root_response_part.result
+            business_logger.info(
+                f"SDR agent task {task_result.id} completed with state: {task_result.status.state}"
             )
             
-            sdk_request = SendMessageRequest(
-                id=str(uuid.uuid4()), params=sdk_send_params
-            )
+            outcome["success"] = True
+            outcome["message"] = f"SDR agent has started processing {business_data.get('name', 'the business')}"
             
-            # Send request to SDR agent
-            response: SendMessageResponse = await a2a_client.send_message(sdk_request)
-            root_response_part = response.root
+        else:
+            business_logger.error(f"Invalid A2A response type: {type(root_response_part)}")
+            outcome["error"] = "Invalid response type"
             
-            if isinstance(root_response_part, JSONRPCErrorResponse):
-                actual_error = root_response_part.error
-                business_logger.error(
-                    f"A2A Error from SDR agent: {actual_error.code} - {actual_error.message}"
-                )
-                outcome["error"] = f"A2A Error: {actual_error.code} - {actual_error.message}"
-                
-            elif isinstance(root_response_part, SendMessageSuccessResponse):
-                task_result: A2ATask = root_response_part.result
-                business_logger.info(
-                    f"SDR agent task {task_result.id} completed with state: {task_result.status.state}"
-                )
-                
-                outcome["success"] = True
-                outcome["message"] = f"SDR agent has started processing {business_data.get('name', 'the business')}"
-                
-            else:
-                business_logger.error(f"Invalid A2A response type: {type(root_response_part)}")
-                outcome["error"] = "Invalid response type"
-                
     except Exception as e:
         if A2A_AVAILABLE and 'A2AClientHTTPError' in str(type(e)):
             business_logger.error(f"HTTP Error calling SDR agent: {e}")
@@ -811,41 +876,41 @@ async def call_sdr_agent_simple(business_data: dict[str, Any], session_id: str)
     }
     
     try:
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            # Try different endpoints that might exist
-            endpoints_to_try = [
-                # f"{sdr_url}/engage_lead",
-                # f"{sdr_url}/process",
-                f"{sdr_url}/",
-            ]
-            
-            sdr_data = {
-                "business": business_data,
-                "session_id": session_id,
-            }
-            
-            for endpoint in endpoints_to_try:
-                try:
-                    business_logger.info(f"Trying SDR endpoint: {endpoint}")
-                    response = await client.post(endpoint, json=sdr_data)
-                    
-                    if response.status_code == 200:
-                        result_data = response.json()
-                        business_logger.info(f"Got response from SDR at {endpoint}: {result_data}")
-                        
-                        outcome["success"] = True
-                        outcome["message"] = f"SDR agent has started processing {business_data.get('name', 'the business')}"
-                        break
-                    
-                    business_logger.warning(f"SDR endpoint {endpoint} returned status {response.status_code}")
+        client = get_http_client()
+        # Try different endpoints that might exist
+        endpoints_to_try = [
+            # f"{sdr_url}/engage_lead",
+            # f"{sdr_url}/process",
+            f"{sdr_url}/",
+        ]
+        
+        sdr_data = {
+            "business": business_data,
+            "session_id": session_id,
+        }
+        
+        for endpoint in endpoints_to_try:
+            try:
+                business_logger.info(f"Trying SDR endpoint: {endpoint}")
+                response = await client.post(endpoint, json=sdr_data, timeout=300.0)
+                
+                if response.status_code == 200:
+                    result_data = response.json()
+                    business_logger.info(f"Got response from SDR at {endpoint}: {result_data}")
                     
-                except Exception as e:
-                    business_logger.warning(f"SDR endpoint {endpoint} failed: {e}")
-                    continue
-            
-            if not outcome["success"]:
-                outcome["error"] = "All SDR agent endpoints failed"
+                    outcome["success"] = True
+                    outcome["message"] = f"SDR agent has started processing {business_data.get('name', 'the business')}"
+                    break
                 
+                business_logger.warning(f"SDR endpoint {endpoint} returned status {response.status_code}")
+                
+            except Exception as e:
+                business_logger.warning(f"SDR endpoint {endpoint} failed: {e}")
+                continue
+        
+        if not outcome["success"]:
+            outcome["error"] = "All SDR agent endpoints failed"
+            
     except Exception as e:
         business_logger.error(f"Unexpected error calling SDR agent: {e}", exc_info=True)
         outcome["error"] = f"Unexpected error: {e}"
@@ -880,81 +945,81 @@ async def call_lead_manager_agent_a2a(query: str, session_id: str) -> dict[str,
     }
     
     try:
-        async with httpx.AsyncClient() as http_client:
-            a2a_client = A2AClient(httpx_client=http_client, url=lead_manager_url)
-            
-            # Prepare A2A message
-            a2a_task_id = f"lead-management-{session_id}"
-            
-            lead_data = {
-                "query": query,
-                "ui_client_url": config.DEFAULT_UI_CLIENT_URL
-            }
-            
-            sdk_message = A2AMessage(
-                taskId=a2a_task_id,
-                contextId=session_id,
-                messageId=str(uuid.uuid4()),
-                role=A2ARole.user,
-                parts=[A2ADataPart(data=lead_data)],
-                metadata={"operation": "process_lead_management", "query": query},
-            )
-            
-            sdk_send_params = MessageSendParams(
-                message=sdk_message,
-                configuration=MessageSendConfiguration(
-                    acceptedOutputModes=["data", "application/json"]
-                ),
+        http_client = get_http_client()
+        a2a_client = A2AClient(httpx_client=http_client, url=lead_manager_url)
+        
+        # Prepare A2A message
+        a2a_task_id = f"lead-management-{session_id}"
+        
+        lead_data = {
+            "query": query,
+            "ui_client_url": config.DEFAULT_UI_CLIENT_URL
+        }
+        
+        sdk_message = A2AMessage(
+            taskId=a2a_task_id,
+            contextId=session_id,
+            messageId=str(uuid.uuid4()),
+            role=A2ARole.user,
+            parts=[A2ADataPart(data=lead_data)],
+            metadata={"operation": "process_lead_management", "query": query},
+        )
+        
+        sdk_send_params = MessageSendParams(
+            message=sdk_message,
+            configuration=MessageSendConfiguration(
+                acceptedOutputModes=["data", "application/json"]
+            ),
+        )
+        
+        sdk_request = SendMessageRequest(
+            id=str(uuid.uuid4()), params=sdk_send_params
+        )
+        
+        # Send request to Lead Manager
+        response: SendMessageResponse = await a2a_client.send_message(sdk_request)
+        root_response_part = response.root
+        
+        if isinstance(root_response_part, JSONRPCErrorResponse):
+            actual_error = root_response_part.error
+            business_logger.error(
+                f"A2A Error from Lead Manager: {actual_error.code} - {actual_error.message}"
             )
+            outcome["error"] = f"A2A Error: {actual_error.code} - {actual_error.message}"
             
-            sdk_request = SendMessageRequest(
-                id=str(uuid.uuid4()), params=sdk_send_params
+        elif isinstance(root_response_part, SendMessageSuccessResponse):
+            task_result: A2ATask = root_response_part.result
+            business_logger.info(
+                f"Lead Manager task {task_result.id} completed with state: {task_result.status.state}"
             )
             
-            # Send request to Lead Manager
-            response: SendMessageResponse = await a2a_client.send_message(sdk_request)
-            root_response_part = response.root
-            
-            if isinstance(root_response_part, JSONRPCErrorResponse):
-                actual_error = root_response_part.error
-                business_logger.error(
-                    f"A2A Error from Lead Manager: {actual_error.code} - {actual_error.message}"
+            # Extract result from artifacts
+            if task_result.artifacts:
+                lead_management_artifact = next(
+                    (
+                        a
+                        for a in task_result.artifacts
+                        if a.name == config.DEFAULT_LEAD_MANAGER_ARTIFACT_NAME
+                    ),
+                    None,
                 )
-                outcome["error"] = f"A2A Error: {actual_error.code} - {actual_error.message}"
-                
-            elif isinstance(root_response_part, SendMessageSuccessResponse):
-                task_result: A2ATask = root_response_part.result
-                business_logger.info(
-                    f"Lead Manager task {task_result.id} completed with state: {task_result.status.state}"
-                )
-                
-                # Extract result from artifacts
-                if task_result.artifacts:
-                    lead_management_artifact = next(
-                        (
-                            a
-                            for a in task_result.artifacts
-                            if a.name == config.DEFAULT_LEAD_MANAGER_ARTIFACT_NAME
-                        ),
-                        None,
-                    )
-                    
-                    if lead_management_artifact and lead_management_artifact.parts:
-                        art_part_root = lead_management_artifact.parts[0].root
-                        if isinstance(art_part_root, A2ADataPart):
-                            result_data = art_part_root.data
-                            business_logger.info(f"Lead Manager Result: {result_data}")
-                            outcome["success"] = True
-                            outcome["message"] = result_data.get("message", "Lead management task completed")
-                
-                if not outcome["success"]:
-                    outcome["success"] = True
-                    outcome["message"] = "Lead management task completed successfully"
-                
-            else:
-                business_logger.error(f"Invalid A2A response type: {type(root_response_part)}")
-                outcome["error"] = "Invalid response type"
                 
+                if lead_management_artifact and lead_management_artifact.parts:
+                    art_part_root = lead_management_artifact.parts[0].root
+                    if isinstance(art_part_root, A2ADataPart):
+                        result_data = art_part_root.data
+                        business_logger.info(f"Lead Manager Result: {result_data}")
+                        outcome["success"] = True
+                        outcome["message"] = result_data.get("message", "Lead management task completed")
+            
+            if not outcome["success"]:
+                outcome["success"] = True
+                outcome["message"] = "Lead management task completed successfully"
+            
+        else:
+            business_logger.error(f"Invalid A2A response type: {type(root_response_part)}")
+            outcome["error"] = "Invalid response type"
+            
     except Exception as e:
         business_logger.warning(f"A2A Lead Manager call failed: {e}")
         outcome["error"] = f"A2A call failed: {e}"
@@ -980,28 +1045,28 @@ async def call_lead_manager_agent_simple(query: str, session_id: str) -> dict[st
     }
     
     try:
-        async with httpx.AsyncClient() as http_client:
-            payload = {
-                "query": query,
-                "ui_client_url": config.DEFAULT_UI_CLIENT_URL
-            }
-            
-            response = await http_client.post(
-                f"{lead_manager_url}/search",
-                json=payload,
-                timeout=30.0
-            )
+        http_client = get_http_client()
+        payload = {
+            "query": query,
+            "ui_client_url": config.DEFAULT_UI_CLIENT_URL
+        }
+        
+        response = await http_client.post(
+            f"{lead_manager_url}/search",
+            json=payload,
+            timeout=30.0
+        )
+        
+        if response.status_code == 200:
+            result = response.json()
+            business_logger.info(f"Lead Manager (simple) responded: {result}")
+            outcome["success"] = True
+            outcome["message"] = result.get("message", "Lead management completed successfully")
+        else:
+            error_msg = f"HTTP {response.status_code}: {response.text}"
+            business_logger.error(f"Lead Manager (simple) error: {error_msg}")
+            outcome["error"] = error_msg
             
-            if response.status_code == 200:
-                result = response.json()
-                business_logger.info(f"Lead Manager (simple) responded: {result}")
-                outcome["success"] = True
-                outcome["message"] = result.get("message", "Lead management completed successfully")
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                business_logger.error(f"Lead Manager (simple) error: {error_msg}")
-                outcome["error"] = error_msg
-                
     except Exception as e:
         business_logger.error(f"Unexpected error calling Lead Manager (simple): {e}", exc_info=True)
         outcome["error"] = f"Unexpected error: {e}"
@@ -2393,17 +2458,18 @@ async def submit_human_input_response(request_id: str, response: HumanInputRespo
     agent_url = os.environ.get("SDR_SERVICE_URL", config.DEFAULT_SDR_URL).rstrip("/")
     callback_url = f"{agent_url}/api/human-input/{request_id}"
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            agent_resp = await client.post(
-                callback_url,
-                json={"url": response.response},
-                headers={"Content-Type": "application/json"}
-            )
-            if agent_resp.status_code == 200:
-                logger.info(f"Successfully notified human creation tool on agent for request {request_id}")
-                success = True
-            else:
-                logger.warning(f"Agent returned status {agent_resp.status_code} for request {request_id}: {agent_resp.text}")
+        client = get_http_client()
+        agent_resp = await client.post(
+            callback_url,
+            json={"url": response.response},
+            headers={"Content-Type": "application/json"},
+            timeout=10.0,
+        )
+        if agent_resp.status_code == 200:
+            logger.info(f"Successfully notified human creation tool on agent for request {request_id}")
+            success = True
+        else:
+            logger.warning(f"Agent returned status {agent_resp.status_code} for request {request_id}: {agent_resp.text}")
     except httpx.ConnectError:
         logger.warning(f"Connection to SDR agent failed for request {request_id}")
     except Exception as e:
@@ -2661,18 +2727,18 @@ async def send_whatsapp_endpoint(request: Request, payload: SendWhatsAppRequest)
 
     # --- Call n8n webhook ---
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(N8N_WHATSAPP_WEBHOOK_URL, json=webhook_payload)
-            if resp.status_code != 200:
-                logger.error(f"n8n webhook returned {resp.status_code}: {resp.text}")
-                return JSONResponse(
-                    status_code=502,
-                    content={"success": False, "error": f"Webhook returned status {resp.status_code}"}
-                )
-            try:
-                n8n_response = resp.json()
-            except Exception:
-                n8n_response = {"raw": resp.text}
+        client = get_http_client()
+        resp = await client.post(N8N_WHATSAPP_WEBHOOK_URL, json=webhook_payload, timeout=10.0)
+        if resp.status_code != 200:
+            logger.error(f"n8n webhook returned {resp.status_code}: {resp.text}")
+            return JSONResponse(
+                status_code=502,
+                content={"success": False, "error": f"Webhook returned status {resp.status_code}"}
+            )
+        try:
+            n8n_response = resp.json()
+        except Exception:
+            n8n_response = {"raw": resp.text}
     except httpx.TimeoutException:
         logger.error("n8n webhook timed out")
         return JSONResponse(status_code=504, content={"success": False, "error": "WhatsApp webhook timed out"})
@@ -2807,8 +2873,8 @@ async def send_confirmation_email(
             )
         
         # Generate a simple confirmation code for easy reference
-        import hashlib
-        confirmation_code = hashlib.md5(f"{business_id}-confirm".encode()).hexdigest()[:8].upper()
+        # (must match the code the email tracker looks for in replies)
+        confirmation_code = generate_reference_code(business_id)
         
         # Create HTML email with confirmation instructions
         html_body = f"""
@@ -3391,5 +3457,6 @@ if __name__ == "__main__":
         "ui_client.main:app",
         host="0.0.0.0",
         port=config.UI_CLIENT_SERVICE_NAME,
-        reload=True
+        reload=True,
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
     )
\ No newline at end of file
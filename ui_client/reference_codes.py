@@ -0,0 +1,15 @@
+"""
+Reference codes that tie a proposal email to its lead.
+
+Shared by the confirmation email (main.py) and the reply tracker
+(email_tracker.py): both sides must derive the same code.
+"""
+
+import functools
+import hashlib
+
+
+@functools.lru_cache(maxsize=4096)
+def generate_reference_code(business_id: str) -> str:
+    """Short uppercase reference code that ties a proposal email to its lead."""
+    return hashlib.blake2b(f"{business_id}-confirm".encode(), digest_size=4).hexdigest().upper()
@@ -0,0 +1,85 @@
+"""
+Tests for lead deduplication in direct Google Maps search:
+the canonical business key and the seen-places Bloom filter.
+
+Run tests with:
+    pytest ui_client/test/test_direct_search.py -v
+"""
+
+import pytest
+
+# Import the module under test
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ui_client.direct_search import _BloomFilter, _business_key
+
+LOC = {"lat": 40.712776, "lng": -74.005974}
+
+
+class TestBusinessKey:
+    """Canonical identity of a business independent of its place_id."""
+
+    def test_name_variants_collapse(self):
+        assert _business_key("Joe's Pizza", "(212) 555-0100", LOC) == \
+            _business_key("Joes Pizza LLC", "+1 212-555-0100", LOC)
+
+    def test_ampersand_matches_and(self):
+        assert _business_key("Smith & Sons", "", LOC) == _business_key("Smith and Sons", "", LOC)
+
+    def test_nearby_coordinates_collapse(self):
+        close_by = {"lat": 40.7128, "lng": -74.0060}
+        assert _business_key("Joe's Pizza", "", LOC) == _business_key("Joe's Pizza", "", close_by)
+
+    def test_different_phone_is_different_business(self):
+        assert _business_key("Joe's Pizza", "2125550100", LOC) != \
+            _business_key("Joe's Pizza", "2125550199", LOC)
+
+    def test_missing_location(self):
+        assert _business_key("Joe's Pizza", "", {}) == "joes pizza||"
+
+
+class TestBloomFilter:
+    """Persistent seen-places filter."""
+
+    def test_added_items_are_members(self):
+        bloom = _BloomFilter(1000, 1e-7)
+        keys = [f"place-{i}" for i in range(500)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+
+    def test_unseen_items_are_not_members(self):
+        bloom = _BloomFilter(1000, 1e-7)
+        for i in range(500):
+            bloom.add(f"place-{i}")
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives == 0
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = str(tmp_path / "seen.bin")
+        bloom = _BloomFilter(1000, 1e-7)
+        bloom.add("place-1")
+        bloom.save(path)
+        assert not bloom.dirty
+
+        restored = _BloomFilter(1000, 1e-7)
+        restored.load(path)
+        assert "place-1" in restored
+        assert "place-2" not in restored
+
+    def test_load_ignores_other_capacity(self, tmp_path):
+        path = str(tmp_path / "seen.bin")
+        bloom = _BloomFilter(1000, 1e-7)
+        bloom.add("place-1")
+        bloom.save(path)
+
+        resized = _BloomFilter(5000, 1e-7)
+        resized.load(path)
+        assert "place-1" not in resized
+
+    def test_save_skipped_when_clean(self, tmp_path):
+        path = tmp_path / "seen.bin"
+        _BloomFilter(1000, 1e-7).save(str(path))
+        assert not path.exists()
@@ -0,0 +1,190 @@
+"""
+Tests for the email reply tracker: reply scoring, quote stripping,
+reference-code matching and the UID cursor.
+
+Run tests with:
+    pytest ui_client/test/test_email_tracker.py -v
+"""
+
+import asyncio
+import email
+import json
+from email import policy
+from email.message import EmailMessage
+
+import pytest
+
+# Import the module under test
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import ui_client.email_tracker as email_tracker
+from ui_client.email_tracker import EmailReplyTracker, generate_reference_code
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    """Tracker with its UID cursor state kept in a temp dir."""
+    monkeypatch.setattr(email_tracker, "STATE_PATH", tmp_path / "state.json")
+    return EmailReplyTracker(email_address="me@example.com", email_password="secret")
+
+
+def _parse(message: EmailMessage):
+    return email.message_from_bytes(message.as_bytes(), policy=policy.default)
+
+
+class TestAnalyzeResponse:
+    """Weighted keyword scoring of reply bodies."""
+
+    def test_positive_reply(self, tracker):
+        assert tracker._analyze_response("yes, i'm interested!") == "positive"
+
+    def test_negative_phrase_beats_contained_positive(self, tracker):
+        """'not interested' is matched as a whole, not as 'interested'."""
+        assert tracker._analyze_response("sorry, not interested") == "negative"
+
+    def test_strong_keyword_outweighs_weak_ones(self, tracker):
+        """'no' counts double, so two weak positives no longer win."""
+        assert tracker._analyze_response("okay, sure, no") == "unclear"
+        assert tracker._analyze_response("ok, no") == "negative"
+
+    def test_whole_word_matching(self, tracker):
+        """'ok' inside 'booking' and 'no' inside 'know' do not count."""
+        assert tracker._analyze_response("i know about the booking") == "unclear"
+
+    def test_quoted_history_is_ignored(self, tracker):
+        body = "yes, let's do it\n\nOn Mon, Jan 1, 2024 you wrote:\n> not interested? reply no"
+        assert tracker._analyze_response(body) == "positive"
+
+    def test_gt_quoted_lines_are_ignored(self, tracker):
+        assert tracker._analyze_response("> no thanks\n> stop") == "unclear"
+
+
+class TestGetEmailBody:
+    """Body extraction for plain and HTML-only replies."""
+
+    def test_plain_preferred_over_html(self, tracker):
+        message = EmailMessage()
+        message.set_content("plain answer")
+        message.add_alternative("<p>html answer</p>", subtype="html")
+        assert tracker._get_email_body(_parse(message)).strip() == "plain answer"
+
+    def test_html_only_reply_drops_blockquote(self, tracker):
+        message = EmailMessage()
+        message.set_content(
+            "<div>Yes, I&#39;m interested!</div>"
+            "<blockquote>Not interested? Just reply no.</blockquote>",
+            subtype="html",
+        )
+        body = tracker._get_email_body(_parse(message))
+        assert "I'm interested!" in body
+        assert "reply no" not in body
+        assert tracker._analyze_response(body.lower()) == "positive"
+
+    def test_html_only_reply_drops_gmail_quote(self, tracker):
+        message = EmailMessage()
+        message.set_content(
+            '<div>no thanks</div><div class="gmail_quote">On Mon you wrote: yes</div>',
+            subtype="html",
+        )
+        body = tracker._get_email_body(_parse(message))
+        assert "you wrote" not in body
+        assert tracker._analyze_response(body.lower()) == "negative"
+
+
+class TestLeadMatching:
+    """Reference codes and business names in replies."""
+
+    def test_reference_code_is_stable(self):
+        assert generate_reference_code("biz-1") == generate_reference_code("biz-1")
+        assert generate_reference_code("biz-1") != generate_reference_code("biz-2")
+        code = generate_reference_code("biz-1")
+        assert len(code) == 8 and code == code.upper()
+
+    def test_reference_code_in_subject(self, tracker):
+        code = tracker.register_pending_lead("biz-1", "Joe's Pizza")
+        tracker.register_pending_lead("biz-2", "Corner Bakery")
+        mention = tracker._find_lead_mention(f"re: lead proposal [{code.lower()}]", "")
+        assert mention == (code, True)
+
+    def test_reference_code_wins_over_business_name(self, tracker):
+        tracker.register_pending_lead("biz-1", "Joe's Pizza")
+        bakery_code = tracker.register_pending_lead("biz-2", "Corner Bakery")
+        mention = tracker._find_lead_mention("re: hello", f"joe's pizza says hi, ref {bakery_code.lower()}")
+        assert mention == (bakery_code, True)
+
+    def test_business_name_match(self, tracker):
+        code = tracker.register_pending_lead("biz-1", "Joe's Pizza")
+        tracker.register_pending_lead("biz-2", "Corner Bakery")
+        assert tracker._find_lead_mention("re: hello", "joe's pizza agrees") == (code, False)
+
+    def test_removed_lead_is_no_longer_matched(self, tracker):
+        code = tracker.register_pending_lead("biz-1", "Joe's Pizza")
+        tracker._remove_pending_lead(code)
+        assert tracker._find_lead_mention(f"re: {code.lower()}", "joe's pizza") is None
+
+
+class TestUidCursor:
+    """The last processed UID only advances after a successful fetch."""
+
+    def test_failed_fetch_keeps_cursor(self, tracker, monkeypatch):
+        tracker.register_pending_lead("biz-1", "Joe's Pizza")
+        tracker._last_uid = 10
+        monkeypatch.setattr(tracker, "_fetch_new_messages", lambda: ([], 0))
+
+        asyncio.run(tracker._check_for_replies())
+
+        assert tracker._last_uid == 10
+        assert not email_tracker.STATE_PATH.exists()
+
+    def test_processed_batch_advances_and_persists_cursor(self, tracker, monkeypatch):
+        tracker.register_pending_lead("biz-1", "Joe's Pizza")
+        tracker._last_uid = 10
+        raw = b"Subject: newsletter\r\nFrom: news@example.com\r\n\r\nhello\r\n"
+        monkeypatch.setattr(tracker, "_fetch_new_messages", lambda: ([(b"1 (UID 42)", raw)], 42))
+
+        asyncio.run(tracker._check_for_replies())
+
+        assert tracker._last_uid == 42
+        state = json.loads(email_tracker.STATE_PATH.read_text())
+        assert state["last_uid"] == 42
+
+
+class _SelectedMailbox:
+    """Stand-in for an IMAP connection right after SELECT."""
+
+    def __init__(self, uidvalidity):
+        self.untagged_responses = {"UIDVALIDITY": [str(uidvalidity).encode()]}
+
+    def response(self, code):
+        return code, self.untagged_responses.pop(code, [None])
+
+    def status(self, *args):
+        raise AssertionError("STATUS must not be sent on the selected mailbox")
+
+
+class TestUidValidity:
+    """UIDVALIDITY is read from the SELECT response, not a STATUS round-trip."""
+
+    def test_unchanged_uidvalidity_keeps_cursor(self, tracker):
+        tracker._uidvalidity = 7
+        tracker._last_uid = 10
+        tracker._sync_uidvalidity(_SelectedMailbox(7))
+        assert tracker._uidvalidity == 7
+        assert tracker._last_uid == 10
+
+    def test_changed_uidvalidity_resets_cursor(self, tracker):
+        tracker._uidvalidity = 7
+        tracker._last_uid = 10
+        tracker._sync_uidvalidity(_SelectedMailbox(8))
+        assert tracker._uidvalidity == 8
+        assert tracker._last_uid == 0
+
+    def test_missing_response_is_ignored(self, tracker):
+        tracker._uidvalidity = 7
+        tracker._last_uid = 10
+        mail = _SelectedMailbox(7)
+        mail.untagged_responses.clear()
+        tracker._sync_uidvalidity(mail)
+        assert (tracker._uidvalidity, tracker._last_uid) == (7, 10)
@@ -0,0 +1,115 @@
+"""
+Tests for the Firebase RTDB service helpers: the /user_leads index
+projection, multi-location updates and client-side push IDs.
+
+Run tests with:
+    pytest ui_client/test/test_firebase_service.py -v
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Import the module under test
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import ui_client.firebase_service as firebase_service
+from ui_client.firebase_service import (
+    INDEX_FIELDS, LeadStatus, _PUSH_CHARS, _generate_push_id, _index_entry,
+    _prefixed, _resolve_col, _safe_key, get_firebase_service,
+)
+
+
+class TestIndexEntry:
+    """Projection of lead fields onto the /user_leads index."""
+
+    def test_only_index_fields_are_kept(self):
+        lead = {"lead_id": "l1", "status": "CONVERTING", "user_email": "a@b.c", "meeting_meet_link": "x"}
+        assert _index_entry(lead) == {"lead_id": "l1", "status": "CONVERTING"}
+
+    def test_none_values_are_dropped(self):
+        assert _index_entry({"lead_id": "l1", "business_phone": None}) == {"lead_id": "l1"}
+
+    def test_research_summary_is_kept_whole(self):
+        """The history page searches the full summary client-side."""
+        summary = "x" * 4000
+        assert _index_entry({"research_summary": summary})["research_summary"] == summary
+
+    def test_every_index_field_is_projected(self):
+        lead = {field: f"v-{field}" for field in INDEX_FIELDS}
+        assert _index_entry(lead) == lead
+
+
+class TestHelpers:
+    """Path and key helpers."""
+
+    def test_prefixed(self):
+        assert _prefixed("/leads/l1", {"status": "A", "updated_at": "t"}) == {
+            "/leads/l1/status": "A",
+            "/leads/l1/updated_at": "t",
+        }
+
+    def test_safe_key(self):
+        assert _safe_key("a.b#c$d[e]f/g") == "a_b_c_d_e_f_g"
+
+    def test_resolve_col(self):
+        assert _resolve_col("  Meeting ") is LeadStatus.MEETING_SCHEDULED
+        assert _resolve_col("sdr") is LeadStatus.ENGAGED_SDR
+        assert _resolve_col("unknown") is None
+
+
+class TestPushIds:
+    """Client-side push IDs follow the Firebase scheme."""
+
+    def test_shape(self):
+        push_id = _generate_push_id()
+        assert len(push_id) == 20
+        assert set(push_id) <= set(_PUSH_CHARS)
+
+    def test_unique_and_ordered(self):
+        ids = [_generate_push_id() for _ in range(2000)]
+        assert len(set(ids)) == len(ids)
+        assert ids == sorted(ids)
+
+    def test_same_millisecond_increments_random_part(self, monkeypatch):
+        monkeypatch.setattr(firebase_service.time, "time", lambda: 1700000000.0)
+        first, second = _generate_push_id(), _generate_push_id()
+        assert first[:8] == second[:8]
+        assert first < second
+
+
+class TestPersistLeadStatus:
+    """persist_lead_status writes lead, index and history in one update."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        svc = get_firebase_service()
+        monkeypatch.setattr(svc, "_available", True)
+        monkeypatch.setattr(svc, "_get_created_at", AsyncMock(return_value="2024-01-01T00:00:00Z"))
+        monkeypatch.setattr(svc, "_update_multi", AsyncMock(return_value=None))
+        return svc
+
+    def test_index_is_merged_per_field(self, service):
+        """A later write without research data must not wipe indexed research fields."""
+        result = asyncio.run(service.persist_lead_status(
+            lead_id="lead.1",
+            status=LeadStatus.MEETING_SCHEDULED,
+            user_info={"user_id": "user-1"},
+            lead_details={"name": "Joe's Pizza", "phone": None},
+            meeting_details={"date": "2024-02-01", "time": "10:00"},
+        ))
+        assert result["success"] is True
+
+        updates = service._update_multi.await_args.args[0]
+        assert "/user_leads/user-1/lead_1" not in updates
+        assert updates["/user_leads/user-1/lead_1/status"] == "MEETING_SCHEDULED"
+        assert updates["/user_leads/user-1/lead_1/meeting_date"] == "2024-02-01"
+        assert not any(key.startswith("/user_leads/user-1/lead_1/research") for key in updates)
+        assert "/leads/lead_1/business_phone" not in updates
+
+        history = [key for key in updates if key.startswith("/leads/lead_1/status_history/")]
+        assert len(history) == 1
+        assert len(history[0].rsplit("/", 1)[1]) == 20